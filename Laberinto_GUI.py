@@ -1,190 +1,98 @@
+import time
 import tkinter as tk
-import random
-import heapq
+from collections import deque
+
+from busqueda import PIGGY, RENE, Game, GameConfig, play
 
 # Definir el tamaño del tablero y los personajes
 CELL_SIZE = 60
 
 class GameGUI:
-    def __init__(self, master, size, rene_start, elmo_start, galleta_start, piggy_start, obstacles):
+    def __init__(self, master, size, rene_start, elmo_start, galleta_start, piggy_start, obstacles, cell_size=CELL_SIZE):
         self.master = master
         self.size = size
-        self.rene_pos = rene_start
-        self.elmo_pos = elmo_start
-        self.galleta_pos = galleta_start
-        self.piggy_pos = piggy_start
-        self.obstacles = obstacles
-        
+        self.cell_size = cell_size
+        self.obstacles = set(obstacles)  # Conjunto: pertenencia en O(1)
+
         # Crear el lienzo
-        self.canvas = tk.Canvas(master, width=size * CELL_SIZE, height=size * CELL_SIZE)
+        self.canvas = tk.Canvas(master, width=size * cell_size, height=size * cell_size)
         self.canvas.pack()
-        
-        # Dibujar el tablero inicial
-        self.draw_board()
-        
-    def draw_board(self):
-        self.canvas.delete("all")
-        
-        # Dibujar las celdas del tablero
-        for i in range(self.size):
-            for j in range(self.size):
-                x1, y1 = j * CELL_SIZE, i * CELL_SIZE
-                x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="black")
-                
-                # Dibujar los obstáculos
-                if (i, j) in self.obstacles:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="gray", outline="black")
-        
-        # Dibujar a René
-        self.draw_character(self.rene_pos, "green")
-        
-        # Dibujar a Elmo
-        self.draw_character(self.elmo_pos, "red")
-        
-        # Dibujar la galleta
-        self.draw_character(self.galleta_pos, "yellow")
-        
-        # Dibujar a Piggy
-        self.draw_character(self.piggy_pos, "pink")
-    
-    def draw_character(self, pos, color):
-        x1, y1 = pos[1] * CELL_SIZE, pos[0] * CELL_SIZE
-        x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
-        self.canvas.create_oval(x1 + 10, y1 + 10, x2 - 10, y2 - 10, fill=color, outline=color)
-    
-    # Actualizar las posiciones y redibujar el tablero
+
+        # Las celdas se crean una sola vez; los turnos solo mueven los óvalos
+        for i in range(size):
+            for j in range(size):
+                x1, y1 = j * cell_size, i * cell_size
+                color = "gray" if (i, j) in self.obstacles else "white"
+                self.canvas.create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size, fill=color, outline="black")
+
+        # Un óvalo por personaje; al moverse solo cambian sus coordenadas
+        self.positions = {}
+        self.characters = {}
+        for name, pos, color in (("rene", rene_start, "green"), ("elmo", elmo_start, "red"),
+                                 ("galleta", galleta_start, "yellow"), ("piggy", piggy_start, "pink")):
+            self.characters[name] = self.canvas.create_oval(*self.oval_coords(pos), fill=color, outline=color)
+            self.positions[name] = pos
+
+        # Tiempos de los últimos cuadros, en segundos
+        self.frames = 0
+        self.frame_times = deque(maxlen=100)
+
+    def oval_coords(self, pos):
+        x1, y1 = pos[1] * self.cell_size, pos[0] * self.cell_size
+        margin = self.cell_size // 6
+        return (x1 + margin, y1 + margin, x1 + self.cell_size - margin, y1 + self.cell_size - margin)
+
+    def move_character(self, name, pos):
+        if self.positions[name] != pos:
+            self.positions[name] = pos
+            self.canvas.coords(self.characters[name], *self.oval_coords(pos))
+
+    # Actualizar las posiciones y redibujar solo lo que cambió
     def update_positions(self, rene_pos, piggy_pos):
-        self.rene_pos = rene_pos
-        self.piggy_pos = piggy_pos
-        self.draw_board()
-
-# Algoritmos y lógica del juego
-def is_valid_move(position, size, obstacles):
-    return (
-        0 <= position[0] < size and 0 <= position[1] < size and position not in obstacles
-    )
-
-def depth_limited_search(rene_pos, elmo_pos, galleta_pos, depth_limit, size, obstacles):
-    stack = [(rene_pos, 0, False)]  # Pila: (posición actual, costo, ha tomado galleta)
-    visited = set()
-    
-    while stack:
-        (current_pos, current_cost, has_galleta) = stack.pop()
-        
-        if current_pos == elmo_pos:
-            return True, current_pos  # René encontró a Elmo
-        
-        if current_cost >= depth_limit or current_pos in visited:
-            continue
-
-        visited.add(current_pos)
-        
-        # Generar los movimientos posibles (arriba, abajo, izquierda, derecha)
-        for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
-            
-            if is_valid_move(new_pos, size, obstacles):
-                new_cost = current_cost + (0.5 if has_galleta else 1)
-                
-                # Si toma la galleta, reduce el costo
-                if new_pos == galleta_pos:
-                    stack.append((new_pos, new_cost, True))
-                else:
-                    stack.append((new_pos, new_cost, has_galleta))
-    
-    return False, current_pos  # No encontró a Elmo
-
-def breadth_first_search(piggy_pos, rene_pos, size, obstacles):
-    queue = [(piggy_pos, 0)]  # Cola: (posición actual, costo)
-    visited = set()
-    
-    while queue:
-        (current_pos, current_cost) = queue.pop(0)
-        
-        if current_pos == rene_pos:
-            return True, current_pos  # Piggy encontró a René
-        
-        if current_pos in visited:
-            continue
-        
-        visited.add(current_pos)
-        
-        # Generar los movimientos posibles (arriba, abajo, izquierda, derecha)
-        for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
-            
-            if is_valid_move(new_pos, size, obstacles):
-                queue.append((new_pos, current_cost + 1))
-    
-    return False, current_pos  # No encontró a René
-
-def astar_search(piggy_pos, rene_pos, size, obstacles):
-    def heuristic(pos1, pos2):
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-    heap = [(0, piggy_pos, 0)]  # Montículo: (costo estimado, posición actual, costo real)
-    visited = set()
-    
-    while heap:
-        (estimated_cost, current_pos, current_cost) = heapq.heappop(heap)
-        
-        if current_pos == rene_pos:
-            return True, current_pos  # Piggy encontró a René
-        
-        if current_pos in visited:
-            continue
-        
-        visited.add(current_pos)
-        
-        # Generar los movimientos posibles (arriba, abajo, izquierda, derecha)
-        for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
-            
-            if is_valid_move(new_pos, size, obstacles):
-                new_cost = current_cost + 1
-                heapq.heappush(heap, (new_cost + heuristic(new_pos, rene_pos), new_pos, new_cost))
-    
-    return False, current_pos  # No encontró a René
+        start = time.perf_counter()
+        self.move_character("rene", rene_pos)
+        self.move_character("piggy", piggy_pos)
+        self.canvas.update_idletasks()
+        self.frame_times.append(time.perf_counter() - start)
+        self.frames += 1
+
+    def frame_time(self):
+        """Mean time of the recent frames, in seconds."""
+        return sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
 
 # Simulación del juego con interfaz gráfica
-def simulate_game_with_gui(master, size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles):
+def simulate_game_with_gui(master, size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles,
+                           cluster_size=0):
     gui = GameGUI(master, size, rene_start, elmo_start, galleta_start, piggy_start, obstacles)
-    rene_pos = rene_start
-    piggy_pos = piggy_start
-    turns = 0
+    game = Game(GameConfig(size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles,
+                           cluster_size=cluster_size))
 
-    def game_turn():
-        nonlocal rene_pos, piggy_pos, turns
-        
-        # Movimiento de René
-        rene_found_elmo, new_rene_pos = depth_limited_search(rene_pos, elmo_start, galleta_start, depth_limit, size, obstacles)
-        rene_pos = new_rene_pos
-        
-        if rene_found_elmo:
-            print(f"René ha encontrado a Elmo en el turno {turns + 1}.")
-            return  # Fin del juego
-        
-        # Movimiento de Piggy
-        if random.random() < 0.4:
+    events = play(game)
+
+    # Consumidor de consola
+    def print_event(event):
+        if event.algorithm == 'A*':
             print("Piggy cambia su estrategia a A*.")
-            piggy_found_rene, new_piggy_pos = astar_search(piggy_pos, rene_pos, size, obstacles)
-        else:
+        elif event.algorithm == 'BFS':
             print("Piggy sigue con BFS.")
-            piggy_found_rene, new_piggy_pos = breadth_first_search(piggy_pos, rene_pos, size, obstacles)
-        
-        piggy_pos = new_piggy_pos
-        
-        if piggy_found_rene:
-            print(f"Piggy ha encontrado a René en el turno {turns + 1}.")
-            return  # Fin del juego
-        
+        if event.winner == RENE:
+            print(f"René ha encontrado a Elmo en el turno {event.turn}.")
+        elif event.winner == PIGGY:
+            print(f"Piggy ha encontrado a René en el turno {event.turn}.")
+        elif event.winner is not None:
+            print("Nadie puede avanzar: fin del juego.")
+
+    def game_turn():
+        event = next(events)
+        print_event(event)
+
         # Actualizar el tablero gráfico
-        gui.update_positions(rene_pos, piggy_pos)
-        
-        # Incrementar el contador de turnos
-        turns += 1
-        
+        gui.update_positions(event.rene, event.piggy)
+
+        if event.winner is not None:
+            print(f"Tiempo medio por cuadro: {gui.frame_time() * 1000:.2f} ms en {gui.frames} cuadros.")
+            return  # Fin del juego
+
         # Pausar un poco antes del siguiente turno
         master.after(500, game_turn)
 
@@ -200,12 +108,13 @@ piggy_start = (5, 0)
 depth_limit = 15
 obstacles = [(1, 1), (1, 2), (2, 2), (3, 1), (4, 4)]
 
-# Crear la ventana principal de la interfaz gráfica
-root = tk.Tk()
-root.title("René y Piggy - Búsqueda Gráfica")
+if __name__ == '__main__':
+    # Crear la ventana principal de la interfaz gráfica
+    root = tk.Tk()
+    root.title("René y Piggy - Búsqueda Gráfica")
 
-# Ejecutar la simulación con la interfaz gráfica
-simulate_game_with_gui(root, size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles)
+    # Ejecutar la simulación con la interfaz gráfica
+    simulate_game_with_gui(root, size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles)
 
-# Ejecutar la interfaz gráfica
-root.mainloop()
+    # Ejecutar la interfaz gráfica
+    root.mainloop()
@@ -1,8 +1,14 @@
 import random
+import sys
 import heapq
+from collections import deque
+from matplotlib.animation import PillowWriter
 from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
+from busqueda import PIGGY, RENE, Board, Grid, TurnEvent, publish, throttled
+
 colors = [
     "#FFFFFF",  # Espacio vacío (blanco)
     "#808080",  # Obstáculo (gris)
@@ -13,57 +19,73 @@ colors = [
 ]
 cmap = ListedColormap(colors)
 
-# Definir el tablero y sus elementos
-class Board:
-    def __init__(self, size, rene_pos, elmo_pos, galleta_pos, piggy_pos, obstacles):
-        self.size = size
-        self.board = [['.' for _ in range(size)] for _ in range(size)]
-        self.rene_pos = rene_pos
-        self.elmo_pos = elmo_pos
-        self.galleta_pos = galleta_pos
-        self.piggy_pos = piggy_pos
-        self.obstacles = obstacles  # Lista de posiciones con obstáculos
-        
-        # Colocar los elementos en el tablero
-        self.update_board()
-
-    def update_board(self):
-        self.board = [['.' for _ in range(self.size)] for _ in range(self.size)]
-        for obs in self.obstacles:
-            self.board[obs[0]][obs[1]] = 'X'
-        self.board[self.rene_pos[0]][self.rene_pos[1]] = 'R'  # René
-        self.board[self.elmo_pos[0]][self.elmo_pos[1]] = 'E'  # Elmo
-        self.board[self.galleta_pos[0]][self.galleta_pos[1]] = 'G'  # Galleta
-        self.board[self.piggy_pos[0]][self.piggy_pos[1]] = 'P'  # Piggy
-
- 
-
-# Función para visualizar el tablero en tiempo real usando matplotlib
-def visualize_board(board):
-    # Mapeo de caracteres a valores numéricos
-    symbol_to_number = {
-        '.': 0,  # Espacio vacío
-        'X': 1,  # Obstáculo
-        'R': 2,  # René
-        'E': 3,  # Elmo
-        'G': 4,  # Galleta
-        'P': 5   # Piggy
-    }
-    # Convertir el tablero en una matriz numérica
-    numeric_board = [[symbol_to_number[cell] for cell in row] for row in board]
-    
-    # Visualizar la matriz numérica
-    plt.clf()
-    plt.imshow(numeric_board, cmap=cmap, vmin=0, vmax=6)
-    plt.xticks([]), plt.yticks([])
-    plt.draw()
-    plt.pause(0.3)
-
-# Verificar si un movimiento es válido (dentro del tablero y no es obstáculo)
-def is_valid_move(position, size, obstacles):
-    return (
-        0 <= position[0] < size and 0 <= position[1] < size and position not in obstacles
-    )
+# Códigos de cada pieza en la imagen; en una misma celda gana la última
+PIECES = {'rene': 2, 'elmo': 3, 'galleta': 4, 'piggy': 5}
+
+# Visualización del tablero con matplotlib: una sola imagen que se actualiza
+class BoardRenderer:
+    """Keeps one AxesImage over a uint8 copy of the board and repaints only moved pieces.
+
+    On screen the image is blitted over a cached background; with ``output``
+    the figure is offscreen and every frame goes straight to a GIF writer.
+    """
+
+    def __init__(self, board, output=None, fps=4, pause=0.3):
+        self.pause = pause
+        self.base = board.grid.occupancy().copy()  # Capa fija: 0 vacío, 1 obstáculo
+        self.frame = self.base.copy()
+        self.positions = dict(board.pieces)
+        for name, pos in self.positions.items():
+            self.frame[pos] = PIECES[name]
+
+        if output is None:
+            plt.ion()  # Modo interactivo de matplotlib
+            self.fig, self.ax = plt.subplots()
+        else:
+            self.fig = Figure()  # Sin ventana: los cuadros van directo al archivo
+            self.ax = self.fig.add_subplot()
+        self.ax.set_xticks([]), self.ax.set_yticks([])
+        self.image = self.ax.imshow(self.frame, cmap=cmap, vmin=0, vmax=6, animated=output is None)
+
+        self.writer = None
+        if output is None:
+            self.fig.canvas.draw()
+            self.background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            self.writer = PillowWriter(fps=fps)
+            self.writer.setup(self.fig, output)
+
+    def repaint(self, pos):
+        self.frame[pos] = self.base[pos]
+        for name, piece_pos in self.positions.items():
+            if piece_pos == pos:
+                self.frame[pos] = PIECES[name]
+
+    def move(self, name, pos):
+        old = self.positions[name]
+        if old != pos:
+            self.positions[name] = pos
+            self.repaint(old)
+            self.repaint(pos)
+
+    def draw(self):
+        self.image.set_data(self.frame)
+        if self.writer is not None:
+            self.writer.grab_frame()
+            return
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        self.ax.draw_artist(self.image)
+        canvas.blit(self.ax.bbox)
+        canvas.start_event_loop(self.pause)  # Pausa sin redibujar toda la figura
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.finish()
+        else:
+            plt.ioff()  # Desactivar modo interactivo
+            self.fig.canvas.draw()
+            plt.show()
 
 def heuristic(pos1, pos2):
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
@@ -76,112 +98,125 @@ def reconstruct_path(node):
         node = node.parent
     return path[::-1]
 
-def main(rene_pos, elmo_pos, galleta_pos, depth_limit, size, obstacles, piggy_pos):
-    board = Board(size, rene_pos, elmo_pos, galleta_pos, piggy_pos, obstacles)
+def turn_events(rene_pos, elmo_pos, galleta_pos, depth_limit, size, obstacles, piggy_pos):
+    """Generator of TurnEvent: one per step of René's depth-first search."""
+    grid = Grid(size, obstacles)
     stack = [(rene_pos, 0, False)]  # Pila: (posición actual, costo, ha tomado galleta)
     heap = []  # Montículo: (costo estimado, posición actual, costo real)
-    queue = [(piggy_pos, 0)]  # Cola: (posición actual, costo)
+    queue = deque([(piggy_pos, 0)])  # Cola: (posición actual, costo)
+    queued_p = {piggy_pos}  # Celdas que ya entraron en la cola de BFS
     visited_R = set()
     visited_p = set()
 
-    current_pos_R = rene_pos
-    current_pos_p = piggy_pos
-    current_cost_R = 0
+    current_pos_p = piggy_pos  # Posición de Piggy en el A*
+    shown_p = piggy_pos  # Última posición de Piggy, la que se dibuja
+    current_cost_p = 0
+    turn = 0
 
-    
     # Inicialización de Piggy en el A* 
     heapq.heappush(heap, (heuristic(piggy_pos, rene_pos), piggy_pos, 0))
 
-    # Inicializar la visualización
-    plt.ion()  # Modo interactivo de matplotlib
-    fig, ax = plt.subplots()
-
     while stack:
-        #print("Rene avanza")
-        print(f"René está en {current_pos_R} con costo {current_cost_R}")
         (current_pos_R, current_cost_R, has_galleta) = stack.pop()
+        if current_pos_R in visited_R:
+            continue
+        turn += 1
 
-        if current_pos_R not in visited_R:
-           board.rene_pos = current_pos_R
-           board.update_board()
-           visualize_board(board.board)
-        
         if current_pos_R == elmo_pos:
-            print(f"\nRené ha encontrado a Elmo en {current_cost_R} movimientos.\n")
-            break  # Encontró a Elmo
-        
-        if current_cost_R >= depth_limit or current_pos_R in visited_R:
-           continue
-        visited_R.add(current_pos_R)     
-        
+            yield TurnEvent(turn, current_pos_R, shown_p, None, has_galleta, current_cost_R, current_cost_p, 0, RENE)
+            return  # Encontró a Elmo
+
+        if current_cost_R >= depth_limit:
+            yield TurnEvent(turn, current_pos_R, shown_p, None, has_galleta, current_cost_R, current_cost_p, 0, None)
+            continue
+        visited_R.add(current_pos_R)
+        expanded = 1
+
         # Generar los movimientos posibles (arriba, abajo, izquierda, derecha)
         for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
             new_pos = (current_pos_R[0] + move[0], current_pos_R[1] + move[1])
-            if is_valid_move(new_pos, size, obstacles):
+            if grid.is_valid_move(new_pos):
                 new_cost = current_cost_R + 1
                 # Si toma la galleta, reduce el costo
                 if new_pos == galleta_pos:
                     new_cost = current_cost_R - 2
-                    print('galleta')
                     stack.append((new_pos, new_cost, True))
                 else:
                     stack.append((new_pos, new_cost, has_galleta))
 
-        #print("piggy avanza")
+        winner = None
         if random.random() <= 0.4:
-            print("Piggy cambia su estrategia a A*.")
-            
-            board.piggy_pos = current_pos_p
-            board.update_board()
-            visualize_board(board.board)
-            
-            if not heap:
-                continue
-            estimated_cost, current_pos_p, current_cost_p = heapq.heappop(heap)
-            print(f"Piggy (A*) está en {current_pos_p} con costo {current_cost_p}")
-            
-            if current_pos_p == current_pos_R:
-                print(f"Piggy ha encontrado a René en {current_cost_p} movimientos.")
-                return  # Piggy encontró a René y termina
-            
-            if current_pos_p in visited_p:
-                continue
-            visited_p.add(current_pos_p)
-            
-            # Generar los movimientos posibles para A*
-            for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_pos_p = (current_pos_p[0] + move[0], current_pos_p[1] + move[1])
-                if is_valid_move(new_pos_p, size, obstacles) and new_pos_p not in visited_p:
-                    new_cost_p = current_cost_p + 1
-                    estimated_cost = new_cost_p + heuristic(new_pos_p, current_pos_R)
-                    heapq.heappush(heap, (estimated_cost, new_pos_p, new_cost_p))
+            algorithm = 'A*'
+            if heap:
+                estimated_cost, current_pos_p, current_cost_p = heapq.heappop(heap)
+                shown_p = current_pos_p
+
+                if current_pos_p == current_pos_R:
+                    winner = PIGGY  # Piggy encontró a René
+                elif current_pos_p not in visited_p:
+                    visited_p.add(current_pos_p)
+                    expanded += 1
+
+                    # Generar los movimientos posibles para A*
+                    for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                        new_pos_p = (current_pos_p[0] + move[0], current_pos_p[1] + move[1])
+                        if grid.is_valid_move(new_pos_p) and new_pos_p not in visited_p:
+                            new_cost_p = current_cost_p + 1
+                            estimated_cost = new_cost_p + heuristic(new_pos_p, current_pos_R)
+                            heapq.heappush(heap, (estimated_cost, new_pos_p, new_cost_p))
         else:
-            print("Piggy sigue con BFS.")
-            if not queue:
-                continue
-            current_pos, current_cost_p = queue.pop(0)
-            board.piggy_pos = current_pos
-            board.update_board()
-            visualize_board(board.board)
-
-            print(f"Piggy (BFS) está en {current_pos} con costo {current_cost_p}")
-            
-            if current_pos == rene_pos:
-                print(f"Piggy ha encontrado a René en {current_cost_p} movimientos.")
-                break # Piggy encontró a René y termina
-            
-            if current_pos in visited_p:
-                continue
-            visited_p.add(current_pos)
-            
-            # Generar los movimientos posibles para BFS
-            for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
-                if is_valid_move(new_pos, size, obstacles) and new_pos not in visited_p:
-                    queue.append((new_pos, current_cost_p + 1))
-
-    plt.ioff()  # Desactivar modo interactivo
-    plt.show()
+            algorithm = 'BFS'
+            if queue:
+                current_pos, current_cost_p = queue.popleft()
+                shown_p = current_pos
+
+                if current_pos == rene_pos:
+                    winner = PIGGY  # Piggy encontró a René
+                elif current_pos not in visited_p:
+                    visited_p.add(current_pos)
+                    expanded += 1
+
+                    # Generar los movimientos posibles para BFS
+                    for move in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                        new_pos = (current_pos[0] + move[0], current_pos[1] + move[1])
+                        if grid.is_valid_move(new_pos) and new_pos not in visited_p and new_pos not in queued_p:
+                            queued_p.add(new_pos)
+                            queue.append((new_pos, current_cost_p + 1))
+
+        yield TurnEvent(turn, current_pos_R, shown_p, algorithm, has_galleta, current_cost_R, current_cost_p, expanded, winner)
+        if winner is not None:
+            return
+
+def print_event(event):
+    print(f"René está en {event.rene} con costo {event.rene_cost}")
+    if event.algorithm == 'A*':
+        print("Piggy cambia su estrategia a A*.")
+    elif event.algorithm == 'BFS':
+        print("Piggy sigue con BFS.")
+    if event.algorithm is not None:
+        print(f"Piggy ({event.algorithm}) está en {event.piggy} con costo {event.piggy_cost}")
+    if event.winner == RENE:
+        print(f"\nRené ha encontrado a Elmo en {event.rene_cost} movimientos.\n")
+    elif event.winner == PIGGY:
+        print(f"Piggy ha encontrado a René en {event.piggy_cost} movimientos.")
+
+def main(rene_pos, elmo_pos, galleta_pos, depth_limit, size, obstacles, piggy_pos, output=None):
+    board = Board(size, rene_pos, elmo_pos, galleta_pos, piggy_pos, obstacles)
+
+    # Inicializar la visualización; con output se graba un GIF sin abrir ventana
+    renderer = BoardRenderer(board, output)
+
+    def draw_event(event):
+        renderer.move('rene', event.rene)
+        renderer.move('piggy', event.piggy)
+        renderer.draw()
+
+    # En pantalla el dibujo descarta los turnos que llegan antes de 0.3 s; el GIF los guarda todos
+    draw = draw_event if output is not None else throttled(draw_event, 0.3)
+    publish(turn_events(rene_pos, elmo_pos, galleta_pos, depth_limit, size, obstacles, piggy_pos),
+            print_event, draw)
+
+    renderer.close()
 
 # Parámetros del juego
 size = 8
@@ -195,4 +230,7 @@ depth_limit = 20
 obstacles = [(1, 1), (1, 2), (5, 4), (4, 4), (3, 3), (7, 2), (6, 3)]
 
 # Iniciar la simulación
-main(rene_start, elmo_start, galleta_start, depth_limit, size, obstacles, piggy_start)
+if __name__ == '__main__':
+    # Uso: python Laberintotry.py [archivo.gif] para grabar la partida sin ventana
+    output = sys.argv[1] if len(sys.argv) > 1 else None
+    main(rene_start, elmo_start, galleta_start, depth_limit, size, obstacles, piggy_start, output)
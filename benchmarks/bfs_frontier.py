@@ -0,0 +1,66 @@
+"""BFS frontier scaling on large open boards.
+
+Compares the old list.pop(0) queue (revisiting duplicates at dequeue time)
+with busqueda.breadth_first_search, which uses a deque and marks cells as
+visited when they are enqueued.
+
+Usage, from the repository root:
+
+    python -m benchmarks.bfs_frontier [size ...]
+"""
+
+import sys
+import time
+
+from busqueda import Grid, GridProblem, breadth_first_search
+
+
+def list_queue_bfs(grid, start, goal):
+    """The queue.pop(0) BFS the game scripts used before the library.
+
+    Returns (found, cost, expanded).
+    """
+    goal = grid.cell_id(goal)
+    cells = grid.cells
+    queue = [(grid.cell_id(start), 0)]
+    visited = bytearray(len(cells))
+    expanded = 0
+    current_cost = None
+
+    while queue:
+        (current, current_cost) = queue.pop(0)
+        if current == goal:
+            return True, current_cost, expanded
+        if visited[current]:
+            continue
+        visited[current] = 1
+        expanded += 1
+        for offset in grid.offsets:
+            new_cell = current + offset
+            if not cells[new_cell]:
+                queue.append((new_cell, current_cost + 1))
+
+    return False, None, expanded
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'size':>6} {'cells':>10} {'list.pop(0) s':>14} {'deque s':>10} {'speedup':>8}")
+    for size in sizes:
+        grid = Grid(size)  # Tablero abierto, sin obstáculos
+        start, goal = (0, 0), (size - 1, size - 1)
+
+        (_, old_cost, _), old_time = timed(list_queue_bfs, grid, start, goal)
+        result, new_time = timed(breadth_first_search, GridProblem(grid, start, goal))
+        assert result.cost == old_cost
+
+        print(f"{size:>6} {size * size:>10} {old_time:>14.3f} {new_time:>10.3f} {old_time / new_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 400, 800, 1600])
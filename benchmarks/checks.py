@@ -0,0 +1,193 @@
+"""Randomized correctness checks for the incremental and pruned searches.
+
+Every search check compares a search against BFS (or A* for René's
+galleta problem and for weighted graphs) on seeded random boards; the
+subscriber check replays a game through ``batched`` and ``throttled``.
+They stop at the first mismatch with an AssertionError.  Usage, from the
+repository root:
+
+    python -m benchmarks.checks [check ...] [--seeds N]
+"""
+
+import argparse
+import random
+
+from busqueda import (
+    CookieProblem, CSRGraph, DStarLite, Game, GameConfig, GridProblem, astar_search, batched,
+    bidirectional_astar_search, breadth_first_search, combined_search, free_positions, generate,
+    iterative_deepening_search, jump_point_search, play, publish, throttled,
+)
+
+
+def assert_path(grid, path, start, goal, cost):
+    """``path`` goes from ``start`` to ``goal`` over free neighboring cells in ``cost`` steps."""
+    assert path[0] == start and path[-1] == goal, (path[:1], path[-1:], start, goal)
+    assert len(path) - 1 == cost, (len(path) - 1, cost)
+    for a, b in zip(path, path[1:]):
+        assert abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1, (a, b)
+        assert grid.is_valid_move(b), b
+
+
+def bfs_cost(grid, start, goal):
+    return breadth_first_search(GridProblem(grid, start, goal)).cost
+
+
+def random_step(grid, position, rng):
+    """A random free neighbor of ``position``, or ``position`` if it is boxed in."""
+    row, col = position
+    options = [(row + dr, col + dc) for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))]
+    options = [p for p in options if grid.is_valid_move(p)]
+    return rng.choice(options) if options else position
+
+
+def check_dstar_lite(seed, size=24, turns=60):
+    """D* Lite while Piggy follows her path, René wanders and walls come and go."""
+    rng = random.Random(seed)
+    grid = generate('random', size, seed=seed, density=0.2)
+    piggy, rene = free_positions(grid, 2, seed=seed)
+    planner = DStarLite(grid, piggy, rene)
+
+    for _ in range(turns):
+        result = planner.search(piggy, rene)
+        expected = bfs_cost(grid, piggy, rene)
+        assert result.cost == expected, (seed, piggy, rene, result.cost, expected)
+        if result.found:
+            assert_path(grid, result.path, piggy, rene, result.cost)
+            if len(result.path) > 1:
+                piggy = result.path[1]
+
+        # René se mueve casi siempre, a veces hacia Piggy por su mismo camino
+        if result.found and len(result.path) > 2 and rng.random() < 0.3:
+            rene = result.path[-2]
+        elif rng.random() < 0.8:
+            rene = random_step(grid, rene, rng)
+
+        # De vez en cuando aparece o desaparece un obstáculo lejos de los agentes
+        if rng.random() < 0.3:
+            position = (rng.randrange(size), rng.randrange(size))
+            if position not in (piggy, rene):
+                planner.set_wall(position, grid.is_valid_move(position))
+
+
+def check_jps(seed, size=40, queries=10):
+    """Jump Point Search on open, random, corridor and maze boards."""
+    rng = random.Random(seed)
+    corridors = generate('random', size, seed=seed, density=0.0)
+    for row in range(2, size - 1, 3):
+        gaps = {rng.randrange(size) for _ in range(2)}
+        for col in range(size):
+            if col not in gaps:
+                corridors.set_wall((row, col))
+    boards = [
+        generate('random', size, seed=seed, density=rng.choice((0.0, 0.1, 0.3))),
+        corridors,
+        generate('backtracker', size - 1, seed=seed),
+    ]
+    for grid in boards:
+        points = free_positions(grid, 2 * queries, seed=seed)
+        for start, goal in zip(points[::2], points[1::2]):
+            result = jump_point_search(GridProblem(grid, start, goal))
+            expected = bfs_cost(grid, start, goal)
+            assert result.cost == expected, (seed, start, goal, result.cost, expected)
+            if result.found:
+                assert_path(grid, result.path, start, goal, result.cost)
+
+
+def check_ida_table(seed, size=12, turns=30):
+    """IDA* reusing one transposition table across turns and starts, as René does."""
+    rng = random.Random(seed)
+    grid = generate('random', size, seed=seed, density=0.2)
+    rene, elmo, galleta = free_positions(grid, 3, seed=seed)
+    table = {}
+    has_galleta = False
+
+    for _ in range(turns):
+        # A veces René aparece en otra celda: las cotas aprendidas siguen valiendo
+        if rng.random() < 0.2:
+            rene = free_positions(grid, 1, seed=rng.randrange(10 ** 6))[0]
+            has_galleta = rng.random() < 0.5
+        problem = CookieProblem(grid, rene, elmo, galleta, has_galleta)
+        result = iterative_deepening_search(problem, size * size, table)
+        expected = astar_search(CookieProblem(grid, rene, elmo, galleta, has_galleta))
+        assert result.cost == expected.cost, (seed, rene, has_galleta, result.cost, expected.cost)
+        if not result.found or rene == elmo:
+            break
+        rene = result.path[1]
+        has_galleta = has_galleta or rene == galleta
+
+
+def check_weighted_bidirectional(seed, size=16, queries=10):
+    """Bidirectional A* on CSR graphs whose edge cost depends on its direction."""
+    rng = random.Random(seed)
+    grid = generate('random', size, seed=seed, density=rng.choice((0.0, 0.1, 0.25)))
+    # El costo depende de la celda de llegada: ir y volver por la misma arista cuesta distinto
+    graph = CSRGraph(grid, diagonal=rng.random() < 0.5, weight_fn=lambda sources, targets: 1 + targets % 3)
+    points = free_positions(grid, 2 * queries, seed=seed)
+    for start, goal in zip(points[::2], points[1::2]):
+        problem = GridProblem(grid, start, goal, graph)
+        expected = astar_search(problem).cost
+        for result in (bidirectional_astar_search(problem),
+                       combined_search(problem, p_astar=1.0, bidirectional=True)):
+            assert result.found == (expected is not None), (seed, start, goal, result.cost, expected)
+            if result.found:
+                assert abs(result.cost - expected) < 1e-9, (seed, start, goal, result.cost, expected)
+                cells = [grid.cell_id(p) for p in result.path]
+                real = sum(graph.step_cost(a, b) for a, b in zip(cells, cells[1:]))
+                assert abs(real - result.cost) < 1e-9, (seed, start, goal, real, result.cost)
+
+
+def check_slow_subscribers(seed, size=16):
+    """``batched`` and ``throttled`` on the events of one game, with a fake clock."""
+    rng = random.Random(seed)
+    grid = generate('random', size, seed=seed, density=0.2)
+    rene, elmo, galleta, piggy = free_positions(grid, 4, seed=seed)
+    config = GameConfig(size, rene, elmo, galleta, piggy, 4 * size, grid, seed=seed, max_turns=50)
+    events = list(play(Game(config)))
+
+    batch_size = rng.randint(1, 5)
+    batches = []
+    shown = []  # (instante, evento) de lo que llega al consumidor lento
+    now = 0.0
+
+    def clock():
+        return now
+
+    batch = batched(batches.append, batch_size)
+    throttle = throttled(lambda event: shown.append((now, event)), 1.0, clock)
+    for event in events:
+        now += rng.random()  # Cada turno tarda entre 0 y 1 segundos
+        publish([event], batch, throttle)
+
+    # Por lotes no se pierde nada: todos los eventos, en orden, en listas de ``batch_size`` salvo la última
+    assert [e for b in batches for e in b] == events, seed
+    assert all(len(b) == batch_size for b in batches[:-1]) and 0 < len(batches[-1]) <= batch_size, seed
+    # Con descarte llegan el primero y el último, y nunca dos en menos de un segundo salvo el final
+    assert shown[0][1] == events[0] and shown[-1][1] == events[-1], seed
+    times = [t for t, event in shown if event.winner is None]
+    assert all(b - a >= 1.0 for a, b in zip(times, times[1:])), seed
+
+CHECKS = {
+    'dstar_lite': check_dstar_lite,
+    'jps': check_jps,
+    'ida_table': check_ida_table,
+    'weighted_bidirectional': check_weighted_bidirectional,
+    'slow_subscribers': check_slow_subscribers,
+}
+
+
+def main(names, seeds):
+    for name in names:
+        for seed in range(seeds):
+            CHECKS[name](seed)
+        print(f"{name}: {seeds} semillas sin diferencias")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('checks', nargs='*', help=f"de {', '.join(CHECKS)} (todas por omisión)")
+    parser.add_argument('--seeds', type=int, default=50)
+    args = parser.parse_args()
+    unknown = set(args.checks) - set(CHECKS)
+    if unknown:
+        parser.error(f"comprobaciones desconocidas: {', '.join(sorted(unknown))}")
+    main(args.checks or list(CHECKS), args.seeds)
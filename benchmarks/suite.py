@@ -0,0 +1,273 @@
+"""Benchmark suite over the searches and the game loops, with JSON output.
+
+Runs BFS, A*, DLS, the old list.pop(0) BFS, A* with landmark (ALT)
+bounds, HPA*, Jump Point Search, the bucketed f-layer A*, whole games
+and multi-agent pursuits on seeded generated boards of several sizes and
+obstacle densities, and stores one record per case so two runs (e.g. two
+commits) can be compared mechanically.  The
+games are the Game and PursuitGame event streams that the scripts
+consume, played headless: printing a large board every turn would
+dominate the measurement.
+
+Times are taken without tracing; every case then runs once more under
+tracemalloc to record its own peak of allocated memory.  Searches that
+need preprocessing (landmarks, HPA*) also record the time and memory of
+building it.
+
+Usage, from the repository root:
+
+    python -m benchmarks.suite [--sizes 64 256 1024 4096] [--output results.json]
+    python -m benchmarks.suite --compare old.json new.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from busqueda import (
+    Game, GameConfig, GridProblem, HierarchicalPlanner, Landmarks, PursuitConfig, PursuitGame, SearchResult,
+    SearchStats, astar_search, breadth_first_search, bucketed_astar_search, depth_limited_search, free_positions,
+    generate, jump_point_search, play, play_pursuit,
+)
+
+from .bfs_frontier import list_queue_bfs
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Tableros: nombre -> (generador, opciones)
+BOARDS = {
+    'open': ('random', {'density': 0.0}),
+    'random10': ('random', {'density': 0.1}),
+    'random25': ('random', {'density': 0.25}),
+    'maze': ('backtracker', {}),
+}
+
+
+def plain(search):
+    """Preparation for a search that needs none: ``search`` on a fresh GridProblem."""
+    def prepare(grid, size):
+        return lambda start, goal, stats: search(GridProblem(grid, start, goal), stats)
+    return prepare
+
+
+def prepare_dls(grid, size):
+    return lambda start, goal, stats: depth_limited_search(GridProblem(grid, start, goal), 2 * size, stats)
+
+
+def prepare_list_bfs(grid, size):
+    def run(start, goal, stats):
+        found, cost, expanded = list_queue_bfs(grid, start, goal)
+        return SearchResult(found, [], cost, expanded)
+    return run
+
+
+def prepare_alt(grid, size):
+    landmarks = Landmarks(grid, count=8)
+    bound = landmarks.lower_bound
+    return lambda start, goal, stats: astar_search(GridProblem(grid, start, goal, heuristic_fn=bound), stats)
+
+
+def prepare_hpa(grid, size):
+    return HierarchicalPlanner(grid, cluster_size=16).search
+
+
+# Búsquedas: nombre -> (preparación por tablero, tamaño máximo de tablero)
+SEARCHES = {
+    'bfs': (plain(breadth_first_search), None),
+    'astar': (plain(astar_search), None),
+    'dls': (prepare_dls, 64),
+    'bfs_list_queue': (prepare_list_bfs, 256),
+    'astar_alt': (prepare_alt, None),
+    'hpa': (prepare_hpa, None),
+    'jps': (plain(jump_point_search), None),
+    'bucketed_astar': (plain(bucketed_astar_search), None),
+}
+
+# Preparaciones que se miden aparte de las consultas
+PREPARED = {'astar_alt', 'hpa'}
+
+
+def traced_peak(fn, *args):
+    """Peak of memory allocated while ``fn(*args)`` runs, in bytes."""
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_searches(name, grid, size, seed, queries, repeat):
+    points = free_positions(grid, 2 * queries, seed=seed)
+    pairs = list(zip(points[::2], points[1::2]))
+    records = []
+    for search, (prepare, max_size) in SEARCHES.items():
+        if max_size is not None and size > max_size:
+            continue
+        begin = time.perf_counter()
+        run = prepare(grid, size)
+        build_time = time.perf_counter() - begin
+
+        stats = None if search == 'bfs_list_queue' else SearchStats()
+        times = []
+        costs = []
+        expanded = 0
+        for start, goal in pairs:
+            # Se guarda el mejor de ``repeat`` tiempos; las cuentas salen de la primera corrida
+            best = None
+            for attempt in range(repeat):
+                begin = time.perf_counter()
+                result = run(start, goal, stats if attempt == 0 else None)
+                elapsed = time.perf_counter() - begin
+                best = elapsed if best is None else min(best, elapsed)
+                if attempt == 0:
+                    expanded += result.expanded
+            times.append(best)
+            costs.append(result.cost)
+
+        record = {
+            'case': f'{search}/{name}/{size}',
+            'kind': 'search',
+            'expanded': expanded,
+            'generated': stats.generated if stats is not None else None,
+            'expansions_per_sec': expanded / max(sum(times), 1e-9),
+            'latency': percentiles(times),
+            'peak_frontier': stats.peak_frontier if stats is not None else None,
+            'peak_memory': traced_peak(lambda: [run(start, goal, None) for start, goal in pairs]),
+            'costs': costs,
+        }
+        if search in PREPARED:
+            record['build_time'] = build_time
+            record['build_memory'] = traced_peak(prepare, grid, size)
+        records.append(record)
+    return records
+
+
+def timed_events(events):
+    """Seconds spent producing each event, plus the total expansions and distance fields."""
+    times = []
+    expanded = fields = 0
+    begin = time.perf_counter()
+    for event in events:
+        times.append(time.perf_counter() - begin)
+        expanded += event.expanded
+        fields += getattr(event, 'fields', 0)
+        begin = time.perf_counter()
+    return times, expanded, fields
+
+
+def run_game(name, grid, size, seed, max_turns):
+    rene, elmo, galleta, piggy = free_positions(grid, 4, seed=seed)
+    config = GameConfig(size, rene, elmo, galleta, piggy, 4 * size, grid, seed=seed, max_turns=max_turns)
+    game = Game(config, collect_stats=True)
+    times, expanded, _ = timed_events(play(game))
+    return {
+        'case': f'game/{name}/{size}',
+        'kind': 'game',
+        'turns': game.turns,
+        'winner': game.winner,
+        'expanded': expanded,
+        'expansions_per_sec': expanded / max(sum(times), 1e-9),
+        'latency': percentiles(times),
+        'peak_memory': traced_peak(lambda: list(play(Game(config)))),
+    }
+
+
+def run_pursuit(name, grid, size, seed, max_turns, renes=4, piggies=32):
+    points = free_positions(grid, renes + piggies + 2, seed=seed)
+    config = PursuitConfig(size, points[2:2 + renes], points[0], points[1], points[2 + renes:], 4 * size, grid,
+                           max_turns=max_turns)
+    game = PursuitGame(config)
+    times, expanded, fields = timed_events(play_pursuit(game))
+    return {
+        'case': f'pursuit/{name}/{size}',
+        'kind': 'pursuit',
+        'renes': renes,
+        'piggies': piggies,
+        'turns': game.turns,
+        'winner': game.winner,
+        'fields_per_turn': fields / max(game.turns, 1),
+        'expanded': expanded,
+        'expansions_per_sec': expanded / max(sum(times), 1e-9),
+        'latency': percentiles(times),
+        'peak_memory': traced_peak(lambda: list(play_pursuit(PursuitGame(config)))),
+    }
+
+
+def percentiles(times):
+    p50, p90, p99 = np.percentile(times, [50, 90, 99]).tolist()
+    return {'p50': p50, 'p90': p90, 'p99': p99, 'max': max(times), 'total': sum(times)}
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main(sizes, output, seed=0, queries=5, repeat=3, max_turns=100):
+    results = []
+    for size in sizes:
+        for name, (kind, options) in BOARDS.items():
+            grid = generate(kind, size, seed=seed, **options)
+            records = run_searches(name, grid, size, seed, queries, repeat)
+            records.append(run_game(name, grid, size, seed, max_turns))
+            records.append(run_pursuit(name, grid, size, seed, max_turns))
+            for record in records:
+                print(f"{record['case']:>28} {record['expansions_per_sec']:>12.0f} exp/s"
+                      f" p50 {1000 * record['latency']['p50']:>9.2f} ms"
+                      f" peak {record['peak_memory'] / 2 ** 20:>8.2f} MB")
+            results.extend(records)
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=1)
+    print(f"Resultados en {output}")
+
+
+def compare(old_path, new_path):
+    """Print the change in throughput, median latency and peak memory of every case in both files."""
+    with open(old_path) as f:
+        old = {r['case']: r for r in json.load(f)['results']}
+    with open(new_path) as f:
+        new = {r['case']: r for r in json.load(f)['results']}
+    print(f"{'case':>28} {'exp/s':>8} {'p50':>8} {'memory':>8}")
+    for case in sorted(old.keys() & new.keys()):
+        speed = new[case]['expansions_per_sec'] / max(old[case]['expansions_per_sec'], 1e-9)
+        latency = new[case]['latency']['p50'] / max(old[case]['latency']['p50'], 1e-9)
+        if 'peak_memory' in old[case] and 'peak_memory' in new[case]:
+            memory = f"{new[case]['peak_memory'] / max(old[case]['peak_memory'], 1):>7.2f}x"
+        else:
+            memory = f"{'-':>8}"
+        print(f"{case:>28} {speed:>7.2f}x {latency:>7.2f}x {memory}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64, 256, 1024])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-turns', type=int, default=100)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    args = parser.parse_args()
+    if args.compare:
+        compare(*args.compare)
+    else:
+        main(args.sizes, args.output, args.seed, args.queries, args.repeat, args.max_turns)
@@ -0,0 +1,62 @@
+"""Shared board representation and search algorithms for the labyrinth games."""
+
+from .batch import RESULT_DTYPE, WINNERS, play_game, run_batch
+from .board import SYMBOLS, Board
+from .buckets import bucketed_astar_search
+from .cache import SHARED_CACHE, CacheInfo, PathCache
+from .console import board_printer, piece_names, print_outcome, simulate_console, turn_printer
+from .cookie import CookieSolver
+from .csr import DIAGONAL_MOVES, CSRGraph
+from .distance import UNREACHABLE, distance_field, gradient_step, wavefront
+from .events import EventMetrics, PursuitEvent, TurnEvent, batched, play, play_pursuit, publish, recorder, throttled
+from .game import DRAW, PIGGY, RENE, Game, GameConfig, config_grid, rene_step, scenario_config
+from .grid import FREE, MOVES, WALL, Grid
+from .hpa import HierarchicalPlanner
+from .incremental import DStarLite
+from .jps import jump_point_search
+from .landmarks import Landmarks
+from .mazegen import GENERATORS, free_positions, generate, prim, random_fill, recursive_backtracker
+from .pursuit import PursuitConfig, PursuitGame
+from .scenario import HEADER_DTYPE, Scenario, load_scenario, save_scenario
+from .search import (
+    CookieProblem,
+    GridProblem,
+    Problem,
+    SearchResult,
+    astar_search,
+    bidirectional_astar_search,
+    bidirectional_breadth_first_search,
+    breadth_first_search,
+    combined_search,
+    depth_limited_search,
+    iterative_deepening_search,
+    reconstruct_path,
+)
+from .stats import SearchStats
+
+__all__ = [
+    'RESULT_DTYPE', 'WINNERS', 'play_game', 'run_batch',
+    'SYMBOLS', 'Board',
+    'bucketed_astar_search',
+    'SHARED_CACHE', 'CacheInfo', 'PathCache',
+    'board_printer', 'piece_names', 'print_outcome', 'simulate_console', 'turn_printer',
+    'CookieSolver',
+    'DIAGONAL_MOVES', 'CSRGraph',
+    'UNREACHABLE', 'distance_field', 'gradient_step', 'wavefront',
+    'EventMetrics', 'PursuitEvent', 'TurnEvent', 'batched', 'play', 'play_pursuit', 'publish', 'recorder',
+    'throttled',
+    'DRAW', 'PIGGY', 'RENE', 'Game', 'GameConfig', 'config_grid', 'rene_step', 'scenario_config',
+    'FREE', 'MOVES', 'WALL', 'Grid',
+    'HierarchicalPlanner',
+    'DStarLite',
+    'jump_point_search',
+    'Landmarks',
+    'GENERATORS', 'free_positions', 'generate', 'prim', 'random_fill', 'recursive_backtracker',
+    'PursuitConfig', 'PursuitGame',
+    'HEADER_DTYPE', 'Scenario', 'load_scenario', 'save_scenario',
+    'CookieProblem', 'GridProblem', 'Problem', 'SearchResult',
+    'astar_search', 'bidirectional_astar_search', 'bidirectional_breadth_first_search',
+    'breadth_first_search', 'combined_search', 'depth_limited_search',
+    'iterative_deepening_search', 'reconstruct_path',
+    'SearchStats',
+]
@@ -0,0 +1,53 @@
+"""Headless Monte Carlo runs of many seeded games across processes."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .cache import SHARED_CACHE
+from .game import DRAW, PIGGY, RENE, Game
+
+WINNERS = (DRAW, RENE, PIGGY)  # Código del ganador en la tabla de resultados
+
+RESULT_DTYPE = np.dtype([
+    ('seed', np.int64),
+    ('turns', np.int32),
+    ('winner', np.uint8),
+    ('expansions', np.int64),
+    ('wall_time', np.float64),
+])
+
+
+def play_game(config, shared_cache=False):
+    """Play one game to the end without any I/O; returns a row of the results table.
+
+    With ``shared_cache`` the game uses this process's SHARED_CACHE, so games
+    on the same board reuse each other's searches.  Costs stay optimal, but
+    ties between equally short paths may then depend on which games ran
+    before in the same worker.
+    """
+    start = time.perf_counter()
+    game = Game(config, cache=SHARED_CACHE if shared_cache else None)
+    while game.winner is None:
+        game.turn()
+    return (config.seed, game.turns, WINNERS.index(game.winner), game.expansions, time.perf_counter() - start)
+
+
+def run_batch(configs, workers=None, chunksize=16, shared_cache=False):
+    """Play every GameConfig and return a structured array with one row per game.
+
+    Games run in a ProcessPoolExecutor with ``workers`` processes (all cores
+    by default); ``workers=1`` plays them in this process.  Rows keep the
+    order of ``configs``.  ``shared_cache`` is passed to play_game.
+    """
+    configs = list(configs)
+    play = partial(play_game, shared_cache=shared_cache)
+    if workers == 1:
+        rows = [play(config) for config in configs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            rows = list(executor.map(play, configs, chunksize=chunksize))
+    return np.array(rows, dtype=RESULT_DTYPE)
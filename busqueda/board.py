@@ -0,0 +1,64 @@
+"""Text board of the scripts: a static wall layer plus a sparse layer of pieces."""
+
+from .grid import Grid
+from .scenario import load_scenario
+
+# Símbolo de cada pieza; si dos coinciden en una celda se ve la última
+SYMBOLS = {'rene': 'R', 'elmo': 'E', 'galleta': 'G', 'piggy': 'P'}
+
+
+def _symbol(name):
+    # 'piggy2', 'rene3'... se dibujan como su tipo de pieza
+    return SYMBOLS[name.rstrip('0123456789')]
+
+
+class Board:
+    """Board whose walls live in a Grid and whose pieces live in a small dict.
+
+    Moving a piece is a single dict assignment, so a turn costs O(1) no
+    matter the size of the board; only ``rows`` and ``display`` walk it.
+    ``obstacles`` may also be a ready-made Grid, which is used as is.
+    Extra pieces such as 'piggy2' are added with ``add_agent``; a piece
+    at position None is not drawn.
+    """
+
+    __slots__ = ('size', 'grid', 'pieces')
+
+    def __init__(self, size, rene_pos, elmo_pos, galleta_pos, piggy_pos, obstacles=()):
+        self.size = size
+        self.grid = obstacles if isinstance(obstacles, Grid) else Grid(size, obstacles)
+        self.pieces = {'rene': rene_pos, 'elmo': elmo_pos, 'galleta': galleta_pos, 'piggy': piggy_pos}
+
+    @classmethod
+    def from_scenario(cls, scenario):
+        """Board for a Scenario (or the path of a scenario file)."""
+        if isinstance(scenario, str):
+            scenario = load_scenario(scenario)
+        return cls(scenario.size, scenario.rene, scenario.elmo, scenario.galleta, scenario.piggy, scenario.grid())
+
+    def add_agent(self, name, position):
+        """Add another piece of a known kind, e.g. 'rene2' or 'piggy3'."""
+        _symbol(name)  # KeyError si el tipo no existe
+        self.pieces[name] = position
+
+    def move_agent(self, name, new_pos):
+        """Move one piece ('rene', 'elmo', 'galleta' or 'piggy') in O(1)."""
+        if name not in self.pieces:
+            raise KeyError(f"pieza desconocida: {name}")
+        self.pieces[name] = new_pos
+
+    def rows(self):
+        """The board as a list of rows of symbols, built on demand."""
+        grid, size = self.grid, self.size
+        rows = []
+        for row in range(size):
+            start = grid.cell_id((row, 0))
+            rows.append(['X' if wall else '.' for wall in grid.cells[start:start + size]])
+        for name, pos in self.pieces.items():
+            if pos is not None:
+                rows[pos[0]][pos[1]] = _symbol(name)
+        return rows
+
+    def display(self):
+        for row in self.rows():
+            print(' '.join(row))
@@ -0,0 +1,96 @@
+"""A* over f-value buckets, expanding a whole layer at a time with NumPy."""
+
+import numpy as np
+
+from .grid import FREE
+from .search import SearchResult
+from .stats import finish
+
+
+def bucketed_astar_search(problem, stats=None):
+    """A* for a GridProblem on a 4-connected, uniform-cost grid; same costs as astar_search.
+
+    With unit steps and the Manhattan heuristic, f is an integer and a move
+    keeps it or raises it by 2, so A* can expand every open cell with the
+    minimum f at once.  Each round takes the cells of the current layer as
+    an array, generates all their neighbors with a few vectorized
+    operations and sends the children with a larger f to their bucket.
+    ``expanded`` counts cells, as in astar_search.  ``stats`` is an
+    optional SearchStats collector; its frontier is the largest layer.
+    """
+    if getattr(problem, 'graph', None) is not None and problem.graph.weights is not None:
+        raise ValueError("bucketed_astar_search necesita pasos de costo 1")
+
+    if stats is not None:
+        stats.start()
+    grid = problem.grid
+    width = grid.width
+    start, goal = problem.start, problem.goal
+    goal_row, goal_col = divmod(goal, width)
+
+    free = np.frombuffer(grid.cells, dtype=np.uint8) == FREE
+    closed = ~free  # Las paredes cuentan como cerradas
+    g = np.full(len(free), -1, dtype=np.int64)
+    parent = np.full(len(free), -1, dtype=np.int64)
+    offsets = np.array(grid.offsets, dtype=np.int64)
+
+    def heuristic(cells):
+        rows, cols = np.divmod(cells, width)
+        return np.abs(rows - goal_row) + np.abs(cols - goal_col)
+
+    g[start] = 0
+    buckets = {int(heuristic(np.array([start]))[0]): [np.array([start], dtype=np.int64)]}
+    expanded = generated = peak = 0
+
+    while buckets:
+        f = min(buckets)
+        layer = np.unique(np.concatenate(buckets.pop(f)))
+        layer = layer[~closed[layer] & (g[layer] + heuristic(layer) == f)]  # Fuera las obsoletas
+
+        while layer.size:
+            if g[goal] == f:
+                result = SearchResult(True, _path(grid, parent, goal), int(f), expanded)
+                return finish(stats, result, generated, peak, g)
+
+            closed[layer] = True
+            expanded += layer.size
+            peak = max(peak, layer.size)
+
+            children = (layer[:, None] + offsets).ravel()
+            sources = np.repeat(layer, len(offsets))
+            keep = ~closed[children]
+            children, sources = children[keep], sources[keep]
+            costs = g[sources] + 1
+
+            # Una celda generada varias veces se queda con su menor costo
+            order = np.lexsort((costs, children))
+            children, sources, costs = children[order], sources[order], costs[order]
+            first = np.ones(len(children), dtype=bool)
+            first[1:] = children[1:] != children[:-1]
+            children, sources, costs = children[first], sources[first], costs[first]
+
+            better = (g[children] < 0) | (costs < g[children])
+            children, sources, costs = children[better], sources[better], costs[better]
+            g[children] = costs
+            parent[children] = sources
+            generated += children.size
+
+            f_children = costs + heuristic(children)
+            same = f_children == f
+            for value in np.unique(f_children[~same]).tolist():
+                buckets.setdefault(value, []).append(children[f_children == value])
+            layer = children[same]
+
+        if g[goal] == f:
+            result = SearchResult(True, _path(grid, parent, goal), int(f), expanded)
+            return finish(stats, result, generated, peak, g)
+
+    return finish(stats, SearchResult(False, [], None, expanded), generated, peak, g)
+
+
+def _path(grid, parent, cell):
+    path = []
+    while cell >= 0:
+        path.append(grid.position(int(cell)))
+        cell = parent[cell]
+    return path[::-1]
@@ -0,0 +1,120 @@
+"""Bounded LRU cache of search results and distance fields shared across games."""
+
+import hashlib
+from collections import OrderedDict, namedtuple
+
+from .distance import distance_field
+from .search import astar_search
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'maxbytes', 'currbytes'])
+
+
+def _nbytes(value):
+    # Memoria de un arreglo NumPy, contando todo el buffer si es una vista
+    base = getattr(value, 'base', None)
+    return getattr(base if base is not None else value, 'nbytes', 0)
+
+
+class PathCache:
+    """LRU cache keyed by (board fingerprint, kind, query...).
+
+    The fingerprint is a hash of the grid cells, so two games on the same
+    board share entries even across Game instances (one cache per batch
+    worker).  It is recomputed only when a different grid is seen or when
+    ``grid.version`` changes; in the latter case the entries of the old
+    board are dropped at once.
+
+    Besides ``maxsize`` entries, the arrays held (distance fields) are
+    bounded to ``maxbytes`` in total; least recently used entries are
+    evicted first, and an array larger than the budget is not stored.
+    """
+
+    def __init__(self, maxsize=4096, maxbytes=64 * 2 ** 20):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._grid = None  # Último tablero visto y su huella
+        self._version = None
+        self._fingerprint = None
+
+    def fingerprint(self, grid):
+        if grid is not self._grid or grid.version != self._version:
+            fingerprint = hashlib.blake2b(grid.cells, digest_size=16).digest()
+            if grid is self._grid and fingerprint != self._fingerprint:
+                self.invalidate(self._fingerprint)  # Cambiaron los obstáculos
+            self._grid, self._version, self._fingerprint = grid, grid.version, fingerprint
+        return self._fingerprint
+
+    def invalidate(self, fingerprint=None):
+        """Drop the entries of one board, or every entry."""
+        if fingerprint is None:
+            self.entries.clear()
+            self.nbytes = 0
+            return
+        for key in [key for key in self.entries if key[0] == fingerprint]:
+            self.nbytes -= _nbytes(self.entries.pop(key))
+
+    def lookup(self, grid, *query):
+        """Cached value for ``query`` on this board, or None; counts a hit or a miss."""
+        key = (self.fingerprint(grid),) + query
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def store(self, grid, *query_and_value):
+        *query, value = query_and_value
+        size = _nbytes(value)
+        if size > self.maxbytes:
+            return value  # No cabe: se devuelve sin guardarlo
+        key = (self.fingerprint(grid),) + tuple(query)
+        if key in self.entries:
+            self.nbytes -= _nbytes(self.entries[key])
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.nbytes += size
+        while len(self.entries) > self.maxsize or self.nbytes > self.maxbytes:
+            _, evicted = self.entries.popitem(last=False)  # Expulsar la entrada menos usada
+            self.nbytes -= _nbytes(evicted)
+        return value
+
+    def search(self, problem, search_fn=astar_search):
+        """``search_fn(problem)`` through the cache; the problem must have a ``grid``.
+
+        A CSRGraph is part of the key through its connectivity; graphs with
+        custom weights or compiled before the grid changed are rejected,
+        since the board fingerprint does not describe them.
+        """
+        graph = getattr(problem, 'graph', None)
+        if graph is not None and (graph.custom_weights or graph.stale):
+            raise ValueError("PathCache.search: el grafo tiene pesos propios o está desactualizado")
+        query = (search_fn.__name__, type(problem).__name__, problem.start, problem.goal,
+                 getattr(problem, 'galleta', None), None if graph is None else graph.diagonal,
+                 problem.heuristic_fn)
+        result = self.lookup(problem.grid, *query)
+        if result is None:
+            result = self.store(problem.grid, *query, search_fn(problem))
+        return result
+
+    def distance_field(self, board, source):
+        """Cached distance_field; the returned array is shared and must not be modified."""
+        grid = getattr(board, 'grid', board)
+        field = self.lookup(grid, 'distance_field', source)
+        if field is None:
+            field = distance_field(grid, source)
+            field.flags.writeable = False
+            self.store(grid, 'distance_field', source, field)
+        return field
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries), self.maxbytes, self.nbytes)
+
+
+# Caché por proceso: la comparten todas las partidas de un mismo trabajador
+SHARED_CACHE = PathCache()
@@ -0,0 +1,98 @@
+"""Text front end of the console scripts: turn subscribers and a game runner."""
+
+from .board import Board
+from .events import PursuitEvent, play, play_pursuit, publish, recorder
+from .game import PIGGY, RENE, Game, GameConfig
+from .pursuit import PursuitConfig, PursuitGame
+
+
+def piece_names(kind, count):
+    """Board names of ``count`` pieces of one kind: 'piggy', 'piggy2', 'piggy3'..."""
+    return [kind] + [f"{kind}{i}" for i in range(2, count + 1)]
+
+
+def turn_printer(prefix=''):
+    """Subscriber that prints the turn number and what Piggy (or the pursuit) did."""
+    def print_event(event):
+        if isinstance(event, PursuitEvent):
+            print(f"{prefix}Turno {event.turn}: {len(event.escaped)} Renés a salvo, {len(event.caught)} atrapados, "
+                  f"{event.fields} campos de distancia para {len(event.piggies)} Piggies.")
+            return
+        print(f"{prefix}Turno {event.turn}")
+        if event.algorithm == 'A*':
+            print("Piggy cambia su estrategia a A*.")
+        elif event.algorithm == 'BFS':
+            print("Piggy sigue con BFS.")
+
+    return print_event
+
+
+def board_printer(board, rene_names=('rene',), piggy_names=('piggy',)):
+    """Subscriber that moves the pieces of ``board`` to the event's positions and prints it."""
+    def show_board(event):
+        if isinstance(event, PursuitEvent):
+            renes, piggies = event.renes, event.piggies
+        else:
+            renes, piggies = (event.rene,), (event.piggy,)
+        for name, pos in zip(rene_names, renes):
+            board.move_agent(name, pos)
+        for name, pos in zip(piggy_names, piggies):
+            board.move_agent(name, pos)
+        print()
+        if event.winner is None:
+            board.display()
+
+    return show_board
+
+
+def print_outcome(event):
+    """Closing line for the last event of a game or a pursuit."""
+    if isinstance(event, PursuitEvent):
+        if event.winner == RENE:
+            print(f"Ganan los Renés: {len(event.escaped)} llegaron a Elmo y {len(event.caught)} fueron atrapados.")
+        elif event.winner == PIGGY:
+            print(f"Ganan los Piggies: atraparon a {len(event.caught)} Renés; {len(event.escaped)} llegaron a Elmo.")
+        else:
+            print("Empate: fin del juego.")
+    elif event.winner == RENE:
+        print(f"René ha encontrado a Elmo en {event.rene_cost} movimientos.")
+    elif event.winner == PIGGY:
+        print(f"Piggy ha encontrado a René en {event.piggy_cost} movimientos.")
+    else:
+        print("Nadie puede avanzar: fin del juego.")
+
+
+def simulate_console(size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, obstacles=(),
+                     stats_file=None, turn_prefix=''):
+    """Play one game in the console, printing the board every turn; returns the last event.
+
+    ``rene_start`` and ``piggy_start`` are positions, or lists of positions
+    for a PursuitGame with several Renés and Piggies.  With ``stats_file``
+    every turn is also written as a JSON line with its search stats.
+    """
+    pursuit = isinstance(rene_start, list) or isinstance(piggy_start, list)
+    renes = rene_start if isinstance(rene_start, list) else [rene_start]
+    piggies = piggy_start if isinstance(piggy_start, list) else [piggy_start]
+    rene_names, piggy_names = piece_names('rene', len(renes)), piece_names('piggy', len(piggies))
+
+    board = Board(size, renes[0], elmo_start, galleta_start, piggies[0], obstacles)
+    for name, pos in list(zip(rene_names, renes))[1:] + list(zip(piggy_names, piggies))[1:]:
+        board.add_agent(name, pos)
+
+    # El motor comparte el Grid del tablero
+    collect_stats = stats_file is not None
+    if pursuit:
+        config = PursuitConfig(size, renes, elmo_start, galleta_start, piggies, depth_limit, board.grid)
+        events = play_pursuit(PursuitGame(config, collect_stats=collect_stats))
+    else:
+        config = GameConfig(size, rene_start, elmo_start, galleta_start, piggy_start, depth_limit, board.grid)
+        events = play(Game(config, collect_stats=collect_stats))
+
+    board.display()
+
+    subscribers = [turn_printer(turn_prefix), board_printer(board, rene_names, piggy_names)]
+    if stats_file is not None:
+        subscribers.append(recorder(stats_file))
+    last = publish(events, *subscribers)
+    print_outcome(last)
+    return last
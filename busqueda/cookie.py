@@ -0,0 +1,93 @@
+"""Route planning for René over cached landmark distance fields."""
+
+from .distance import distance_field
+from .search import INF
+
+
+class CookieSolver:
+    """Answers "go via a galleta or straight to Elmo" from precomputed distances.
+
+    One distance field is kept per point of interest (Elmo and every
+    galleta).  Since the board is undirected, ``field[p]`` is also the
+    distance from any position ``p`` to that landmark, so a single-galleta
+    decision is three array lookups.  Fields are computed on first use and
+    dropped when the grid version changes.
+
+    Every galleta eaten halves the cost of the following steps, so with
+    several galletas the best order is a small TSP over the landmarks,
+    solved with Held-Karp.
+    """
+
+    def __init__(self, grid, elmo, galletas):
+        self.grid = grid
+        self.elmo = elmo
+        self.galletas = tuple(galletas)
+        self._fields = {}
+        self._version = grid.version
+
+    def field(self, landmark):
+        if self._version != self.grid.version:
+            self._fields.clear()  # Cambiaron los obstáculos
+            self._version = self.grid.version
+        field = self._fields.get(landmark)
+        if field is None:
+            field = self._fields[landmark] = distance_field(self.grid, landmark)
+        return field
+
+    def distance(self, position, landmark):
+        steps = self.field(landmark)[position]
+        return INF if steps < 0 else int(steps)
+
+    def best_route(self, position, remaining=None, eaten=0):
+        """(cost, route) of the cheapest walk from ``position`` to Elmo.
+
+        ``route`` lists the galletas to pick up, in order, followed by Elmo.
+        ``remaining`` defaults to every galleta; ``eaten`` is how many were
+        already eaten.
+        """
+        remaining = self.galletas if remaining is None else tuple(remaining)
+        best = (self.distance(position, self.elmo) * 0.5 ** eaten, (self.elmo,))
+        if not remaining:
+            return best
+
+        # Held-Karp: costs[(mask, last)] = (costo, galleta previa)
+        costs = {}
+        for i, galleta in enumerate(remaining):
+            costs[(1 << i, i)] = (self.distance(position, galleta) * 0.5 ** eaten, None)
+        for mask in range(1, 1 << len(remaining)):
+            factor = 0.5 ** (eaten + bin(mask).count('1'))
+            for last in range(len(remaining)):
+                entry = costs.get((mask, last))
+                if entry is None or entry[0] == INF:
+                    continue
+                cost = entry[0]
+
+                total = cost + self.distance(remaining[last], self.elmo) * factor
+                if total < best[0]:
+                    best = (total, (mask, last))
+
+                for nxt in range(len(remaining)):
+                    if mask & (1 << nxt):
+                        continue
+                    key = (mask | (1 << nxt), nxt)
+                    new_cost = cost + self.distance(remaining[last], remaining[nxt]) * factor
+                    if new_cost < costs.get(key, (INF,))[0]:
+                        costs[key] = (new_cost, last)
+
+        total, end = best
+        if end == (self.elmo,):
+            return best
+        route = [self.elmo]
+        mask, last = end
+        while last is not None:
+            route.append(remaining[last])
+            mask, last = mask ^ (1 << last), costs[(mask, last)][1]
+        return total, tuple(reversed(route))
+
+    def lower_bound(self, state, goal=None):
+        """Exact cost to Elmo for a CookieProblem state, usable as its heuristic."""
+        cell, has_galleta = state
+        position = self.grid.position(cell)
+        if has_galleta:
+            return self.best_route(position, (), eaten=1)[0]
+        return self.best_route(position)[0]
@@ -0,0 +1,110 @@
+"""Board adjacency compiled once into compressed sparse row (CSR) arrays."""
+
+from array import array
+from math import sqrt
+
+import numpy as np
+
+from .grid import FREE, MOVES
+
+SQRT2 = sqrt(2)
+
+# Movimientos diagonales para la conectividad 8
+DIAGONAL_MOVES = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class CSRGraph:
+    """Adjacency of the passable cells of a Grid (or Board) in CSR form.
+
+    ``nodes`` holds the cell id of every passable cell and ``index`` maps a
+    cell id back to its node (-1 for walls).  The neighbors of node ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]`` with costs ``weights`` (None when
+    every edge costs 1).  With ``diagonal`` the graph is 8-connected,
+    diagonals cost sqrt(2) and may not cut the corner of a wall.
+    ``weight_fn(source_cells, target_cells)`` may replace the costs with an
+    array computed for all edges at once.
+
+    ``neighbors`` and ``step_cost`` take and return cell ids, so the graph
+    plugs into any Problem as its ``neighbors_fn``.  The graph is a
+    snapshot: rebuild it when ``stale`` says the grid changed.
+    """
+
+    def __init__(self, board, diagonal=False, weight_fn=None):
+        grid = getattr(board, 'grid', board)
+        self.grid = grid
+        self.diagonal = diagonal
+        self.version = grid.version
+        self.custom_weights = weight_fn is not None
+
+        free = np.frombuffer(grid.cells, dtype=np.uint8) == FREE
+        nodes = np.flatnonzero(free)
+        index = np.full(len(free), -1, dtype=np.int64)
+        index[nodes] = np.arange(len(nodes))
+
+        # Aristas por dirección, en el mismo orden que MOVES
+        sources, targets, costs = [], [], []
+        for dr, dc in MOVES + (DIAGONAL_MOVES if diagonal else []):
+            target = nodes + (dr * grid.width + dc)
+            ok = free[target]
+            if dr and dc:
+                ok &= free[nodes + dr * grid.width] & free[nodes + dc]  # Sin cortar esquinas
+            sources.append(np.flatnonzero(ok))
+            targets.append(target[ok])
+            costs.append(np.full(int(ok.sum()), SQRT2 if dr and dc else 1.0))
+
+        source = np.concatenate(sources)
+        order = np.argsort(source, kind='stable')
+        source = source[order]
+        target = np.concatenate(targets)[order]
+
+        self.nodes = nodes
+        self.index = index
+        self.indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=len(nodes)), out=self.indptr[1:])
+        self.indices = index[target]
+        if weight_fn is not None:
+            self.weights = np.asarray(weight_fn(nodes[source], target), dtype=np.float64)
+        elif diagonal:
+            self.weights = np.concatenate(costs)[order]
+        else:
+            self.weights = None
+        self.min_weight = float(self.weights.min()) if self.weights is not None and len(self.weights) else 1.0
+
+        # Copias en array.array: indexarlas desde Python da int sin pasar por NumPy
+        self._index = array('q', index.tobytes())
+        self._indptr = array('q', self.indptr.tobytes())
+        self._targets = array('q', target.astype(np.int64).tobytes())
+        self._weights = None if self.weights is None else array('d', self.weights.tobytes())
+
+    @property
+    def stale(self):
+        return self.version != self.grid.version
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def neighbors(self, cell):
+        """Cell ids adjacent to ``cell``, as a slice of one flat integer array."""
+        node = self._index[cell]
+        return self._targets[self._indptr[node]:self._indptr[node + 1]]
+
+    def step_cost(self, cell, next_cell):
+        if self._weights is None:
+            return 1
+        node = self._index[cell]
+        targets = self._targets
+        for edge in range(self._indptr[node], self._indptr[node + 1]):
+            if targets[edge] == next_cell:
+                return self._weights[edge]
+        raise KeyError(f"no hay arista entre {cell} y {next_cell}")
+
+    def lower_bound(self, cell, target):
+        """Admissible estimate of the cost between two cell ids."""
+        row, col = divmod(cell, self.grid.width)
+        target_row, target_col = divmod(target, self.grid.width)
+        dr, dc = abs(row - target_row), abs(col - target_col)
+        if not self.diagonal:
+            return self.min_weight * (dr + dc)
+        if not self.custom_weights:
+            return dr + dc + (SQRT2 - 2) * min(dr, dc)  # Distancia octil
+        return self.min_weight * max(dr, dc)
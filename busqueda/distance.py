@@ -0,0 +1,76 @@
+"""Whole-board distance fields computed with a vectorized BFS wavefront."""
+
+import numpy as np
+
+from .grid import FREE, MOVES
+
+UNREACHABLE = -1
+
+
+def _as_grid(board):
+    # Acepta un Grid o cualquier objeto que tenga uno en ``board.grid``
+    return getattr(board, 'grid', board)
+
+
+def wavefront(grid, source, stats=None):
+    """BFS distances from cell id ``source`` over the flat padded grid.
+
+    Each layer of the BFS is expanded with a handful of NumPy operations on
+    the array of frontier cell ids.  Unreachable cells and walls get -1.
+    ``stats`` is an optional SearchStats collector; its frontier is the
+    largest layer.
+    """
+    if stats is not None:
+        stats.start()
+    free = np.frombuffer(grid.cells, dtype=np.uint8) == FREE  # Copia: se marca al visitar
+    dist = np.full(len(grid.cells), UNREACHABLE, dtype=np.int32)
+    if not free[source]:
+        if stats is not None:
+            stats.record(0, 0, 0, dist)
+        return dist
+
+    offsets = np.array(grid.offsets, dtype=np.intp)
+    frontier = np.array([source], dtype=np.intp)
+    free[source] = False
+    dist[source] = 0
+    layer = 0
+    reached = peak = 1
+
+    while frontier.size:
+        layer += 1
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = np.unique(candidates[free[candidates]])
+        free[candidates] = False
+        dist[candidates] = layer
+        frontier = candidates
+        reached += frontier.size
+        peak = max(peak, frontier.size)
+
+    if stats is not None:
+        stats.record(reached, reached - 1, peak, dist)
+    return dist
+
+
+def distance_field(board, source, stats=None):
+    """size x size array with the number of steps from every cell to ``source``."""
+    grid = _as_grid(board)
+    dist = wavefront(grid, grid.cell_id(source), stats)
+    return dist.reshape(grid.width, grid.width)[1:-1, 1:-1]
+
+
+def gradient_step(field, position):
+    """Neighbor of ``position`` that is one step closer to the field's source.
+
+    Returns ``position`` itself when it is the source or cannot reach it.
+    """
+    row, col = position
+    best, best_dist = position, field[row, col]
+    if best_dist <= 0:
+        return position
+
+    size = field.shape[0]
+    for dr, dc in MOVES:
+        r, c = row + dr, col + dc
+        if 0 <= r < size and 0 <= c < size and 0 <= field[r, c] < best_dist:
+            best, best_dist = (r, c), field[r, c]
+    return best
@@ -0,0 +1,133 @@
+"""Stream of turn events out of a game, and helpers to fan it out to consumers.
+
+The game loop only produces TurnEvent tuples; printing, drawing, recording
+and metrics are subscribers, plain callables that take one event.  A
+headless run simply never subscribes anything.
+"""
+
+import json
+import time
+from collections import Counter, namedtuple
+
+TurnEvent = namedtuple(
+    'TurnEvent',
+    ['turn', 'rene', 'piggy', 'algorithm', 'has_galleta', 'rene_cost', 'piggy_cost', 'expanded', 'winner', 'stats'],
+    defaults=(None,),
+)
+
+
+def play(game):
+    """Generator of one TurnEvent per turn of a Game, until it has a winner.
+
+    When the game collects stats, ``stats`` maps 'rene' and 'piggy' to the
+    SearchStats of the turn as plain dicts.
+    """
+    while game.winner is None:
+        expansions = game.expansions
+        algorithm = game.turn()
+        stats = None
+        if game.turn_stats is not None:
+            stats = {side: collector.as_dict() for side, collector in game.turn_stats.items()}
+        yield TurnEvent(
+            game.turns, game.rene_pos, game.piggy_pos, algorithm, game.has_galleta,
+            game.rene_cost, game.piggy_moves, game.expansions - expansions, game.winner, stats,
+        )
+
+
+PursuitEvent = namedtuple(
+    'PursuitEvent',
+    ['turn', 'renes', 'piggies', 'escaped', 'caught', 'fields', 'expanded', 'winner', 'stats'],
+    defaults=(None,),
+)
+
+
+def play_pursuit(game):
+    """Generator of one PursuitEvent per turn of a PursuitGame, until it has a winner.
+
+    ``renes`` and ``piggies`` are tuples of positions (None for a René that
+    left the board) and ``fields`` counts the distance fields the turn
+    computed.
+    """
+    while game.winner is None:
+        expansions = game.expansions
+        game.turn()
+        stats = None
+        if game.turn_stats is not None:
+            stats = {side: collector.as_dict() for side, collector in game.turn_stats.items()}
+        yield PursuitEvent(
+            game.turns, tuple(game.renes), tuple(game.piggies), tuple(game.escaped), tuple(game.caught),
+            game.fields, game.expansions - expansions, game.winner, stats,
+        )
+
+
+def publish(events, *subscribers):
+    """Hand every event to each subscriber in order; returns the last event."""
+    event = None
+    for event in events:
+        for subscriber in subscribers:
+            subscriber(event)
+    return event
+
+
+def throttled(subscriber, interval, clock=time.monotonic):
+    """Forward at most one event every ``interval`` seconds and drop the rest.
+
+    The event that ends the game is always delivered.
+    """
+    last = None
+
+    def forward(event):
+        nonlocal last
+        now = clock()
+        if event.winner is None and last is not None and now - last < interval:
+            return  # Consumidor lento: se descarta el cuadro
+        last = now
+        subscriber(event)
+
+    return forward
+
+
+def batched(subscriber, size):
+    """Deliver events in lists of ``size``; the last list is flushed when the game ends."""
+    pending = []
+
+    def collect(event):
+        pending.append(event)
+        if len(pending) >= size or event.winner is not None:
+            subscriber(list(pending))
+            pending.clear()
+
+    return collect
+
+
+def recorder(file):
+    """Write each event as one line of JSON to an open text file."""
+    def record(event):
+        file.write(json.dumps(event._asdict(), ensure_ascii=False) + '\n')
+    return record
+
+
+class EventMetrics:
+    """Subscriber that aggregates turns, expansions and Piggy's choice of algorithm.
+
+    With per-turn stats, ``cpu_time`` adds up the CPU seconds of René
+    ('René') and of each of Piggy's algorithms.
+    """
+
+    def __init__(self):
+        self.turns = 0
+        self.expanded = 0
+        self.algorithms = Counter()
+        self.cpu_time = Counter()
+        self.winner = None
+
+    def __call__(self, event):
+        self.turns = event.turn
+        self.expanded += event.expanded
+        if event.algorithm is not None:
+            self.algorithms[event.algorithm] += 1
+        if event.stats is not None:
+            self.cpu_time['René'] += event.stats['rene']['cpu_time']
+            if event.algorithm is not None:
+                self.cpu_time[event.algorithm] += event.stats['piggy']['cpu_time']
+        self.winner = event.winner
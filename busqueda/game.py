@@ -0,0 +1,159 @@
+"""Headless René vs Piggy game engine shared by the scripts and the batch runner."""
+
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import PathCache
+from .cookie import CookieSolver
+from .distance import distance_field, gradient_step
+from .grid import Grid
+from .hpa import HierarchicalPlanner
+from .incremental import DStarLite
+from .scenario import Scenario
+from .search import CookieProblem, iterative_deepening_search
+from .stats import SearchStats
+
+GameConfig = namedtuple(
+    'GameConfig',
+    ['size', 'rene', 'elmo', 'galleta', 'piggy', 'depth_limit', 'obstacles', 'seed', 'p_astar', 'max_turns',
+     'cluster_size'],
+    defaults=((), 0, 0.4, 1000, 0),
+)
+
+RENE, PIGGY, DRAW = 'René', 'Piggy', 'empate'
+
+
+def scenario_config(scenario, **overrides):
+    """GameConfig for a Scenario; the board stays in the file until the game starts."""
+    config = GameConfig(
+        scenario.size, scenario.rene, scenario.elmo, scenario.galleta, scenario.piggy,
+        scenario.depth_limit, obstacles=scenario, seed=scenario.seed,
+    )
+    return config._replace(**overrides)
+
+
+def config_grid(config):
+    """Grid of a config whose ``obstacles`` are a Scenario, a Grid or a list of positions."""
+    if isinstance(config.obstacles, Scenario):
+        return config.obstacles.grid()
+    if isinstance(config.obstacles, Grid):
+        return config.obstacles  # Tablero ya construido, como en Board
+    return Grid(config.size, config.obstacles)
+
+
+def rene_step(game, position, has_galleta, stats=None):
+    """One step of René's IDA* towards Elmo through ``game``'s cache and transposition table.
+
+    ``game`` is a Game or a PursuitGame.  Returns the search result and
+    René's position, galleta flag and step cost after the move; the cost
+    is 0 when he cannot move.
+    """
+    config, grid = game.config, game.grid
+    problem = CookieProblem(grid, position, config.elmo, config.galleta, has_galleta, game.solver.lower_bound)
+    query = ('rene', problem.start, problem.goal, problem.galleta, config.depth_limit)
+    rene = game.cache.lookup(grid, *query)
+    if rene is None:
+        rene = iterative_deepening_search(problem, config.depth_limit, game.rene_table, stats)
+        game.expansions += rene.expanded
+        game.cache.store(grid, *query, rene)
+    if not rene.found or len(rene.path) < 2:
+        return rene, position, has_galleta, 0
+    position = rene.path[1]
+    return rene, position, has_galleta or position == config.galleta, 0.5 if has_galleta else 1
+
+
+class Game:
+    """One game: every turn René and Piggy advance one step along their paths.
+
+    René runs IDA* towards Elmo with the exact CookieSolver heuristic and a
+    transposition table kept between turns.  Piggy switches to A* (an
+    incremental D* Lite planner) with probability ``p_astar`` and otherwise
+    steps down the BFS distance field from René.  With a ``cluster_size``
+    in the config, Piggy's A* is a HierarchicalPlanner (HPA*) instead:
+    near-optimal paths whose cost barely grows with the board.  ``turn``
+    does no I/O.
+
+    Search results and distance fields go through ``cache`` (a PathCache),
+    so a turn that repeats an earlier query is a dictionary lookup.  By
+    default every game gets its own cache; pass a shared one to reuse
+    results between games on the same board.
+
+    With ``collect_stats`` every turn leaves in ``turn_stats`` one
+    SearchStats for René's searches and one for Piggy's.
+    """
+
+    def __init__(self, config, rng=None, cache=None, collect_stats=False):
+        self.config = config
+        self.rng = rng if rng is not None else random.Random(config.seed)
+        self.cache = cache if cache is not None else PathCache()  # Propia de la partida si no se comparte
+        self.grid = config_grid(config)
+        self.solver = CookieSolver(self.grid, config.elmo, [config.galleta])
+        self.rene_table = {}  # Cotas aprendidas por el IDA* de René, válidas entre turnos
+        self.planner = None  # D* Lite o HPA* de Piggy: conserva sus tablas entre turnos
+        self.collect_stats = collect_stats
+        self.turn_stats = None
+
+        self.rene_pos = config.rene
+        self.piggy_pos = config.piggy
+        self.has_galleta = False
+        self.rene_cost = 0
+        self.piggy_moves = 0
+        self.turns = 0
+        self.expansions = 0
+        self.winner = None
+
+    def turn(self):
+        """Play one turn; returns Piggy's algorithm ('A*' or 'BFS'), or None if she did not move."""
+        config, grid = self.config, self.grid
+        rene_stats = piggy_stats = None
+        if self.collect_stats:
+            rene_stats, piggy_stats = SearchStats(), SearchStats()
+            self.turn_stats = {'rene': rene_stats, 'piggy': piggy_stats}
+
+        # Movimiento de René (IDA* hacia Elmo)
+        rene, self.rene_pos, self.has_galleta, cost = rene_step(self, self.rene_pos, self.has_galleta, rene_stats)
+        self.rene_cost += cost
+
+        self.turns += 1
+        if self.rene_pos == config.elmo:
+            self.winner = RENE
+            return None
+
+        # Movimiento de Piggy
+        if self.rng.random() < config.p_astar:
+            algorithm = 'A*'
+            query = ('piggy', config.cluster_size, self.piggy_pos, self.rene_pos)
+            piggy = self.cache.lookup(grid, *query)
+            if piggy is None:
+                if self.planner is None and config.cluster_size:
+                    self.planner = HierarchicalPlanner(grid, config.cluster_size)
+                elif self.planner is None:
+                    self.planner = DStarLite(grid, self.piggy_pos, self.rene_pos)
+                piggy = self.planner.search(self.piggy_pos, self.rene_pos, piggy_stats)
+                self.expansions += piggy.expanded
+                self.cache.store(grid, *query, piggy)
+            piggy_found = piggy.found
+            next_pos = piggy.path[1] if len(piggy.path) > 1 else self.piggy_pos
+        else:
+            algorithm = 'BFS'
+            # Campo de distancias a René: Piggy baja por el gradiente
+            field = self.cache.lookup(grid, 'distance_field', self.rene_pos)
+            if field is None:
+                field = distance_field(grid, self.rene_pos, piggy_stats)
+                self.expansions += int(np.count_nonzero(field >= 0))
+                field.flags.writeable = False  # Compartido por la caché, como en PathCache.distance_field
+                self.cache.store(grid, 'distance_field', self.rene_pos, field)
+            piggy_found = field[self.piggy_pos] >= 0
+            next_pos = gradient_step(field, self.piggy_pos)
+
+        if next_pos != self.piggy_pos:
+            self.piggy_moves += 1
+            self.piggy_pos = next_pos
+
+        if self.piggy_pos == self.rene_pos:
+            self.winner = PIGGY
+        elif (not rene.found and not piggy_found) or self.turns >= config.max_turns:
+            self.winner = DRAW  # Nadie puede avanzar o se acabaron los turnos
+        return algorithm
@@ -0,0 +1,103 @@
+"""Occupancy grid shared by every search in the project."""
+
+import numpy as np
+
+FREE = 0
+WALL = 1
+
+# Movimientos posibles (derecha, izquierda, abajo, arriba)
+MOVES = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+
+
+class Grid:
+    """Square occupancy grid stored as a flat bytearray of cell ids.
+
+    The board is surrounded by a one-cell border of walls, so the neighbors
+    of a cell are always ``cell + offset`` and never need a bounds check.
+    """
+
+    __slots__ = ('size', 'width', 'cells', 'offsets', 'version')
+
+    def __init__(self, size, obstacles=()):
+        self.size = size
+        self.width = size + 2
+        self.cells = bytearray([WALL]) * (self.width * self.width)
+
+        # Vaciar el interior del tablero, dejando el borde como pared
+        for row in range(1, size + 1):
+            start = row * self.width + 1
+            self.cells[start:start + size] = bytes(size)
+
+        for obs in obstacles:
+            self.cells[self.cell_id(obs)] = WALL
+
+        # Desplazamientos precalculados para cada movimiento
+        self.offsets = tuple(dr * self.width + dc for dr, dc in MOVES)
+
+        # Aumenta cada vez que cambian los obstáculos
+        self.version = 0
+
+    @classmethod
+    def from_occupancy(cls, occupancy):
+        """Grid from a size x size array whose nonzero cells are obstacles."""
+        occupancy = np.asarray(occupancy)
+        grid = cls(occupancy.shape[0])
+        grid.set_occupancy(occupancy)
+        return grid
+
+    def occupancy(self):
+        """size x size read-only uint8 view of the board (1 = obstacle)."""
+        cells = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.width, self.width)
+        view = cells[1:-1, 1:-1]
+        view.flags.writeable = False  # Solo set_wall y set_occupancy cambian el tablero y su versión
+        return view
+
+    def set_occupancy(self, occupancy):
+        """Replace every cell from a size x size array whose nonzero cells are obstacles."""
+        cells = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.width, self.width)
+        cells[1:-1, 1:-1] = np.asarray(occupancy) != 0
+        self.version += 1
+
+    def cell_id(self, position):
+        """Integer id of a (row, col) position."""
+        return (position[0] + 1) * self.width + position[1] + 1
+
+    def position(self, cell):
+        """(row, col) position of an integer cell id."""
+        row, col = divmod(cell, self.width)
+        return (row - 1, col - 1)
+
+    def is_passable(self, cell):
+        return not self.cells[cell]
+
+    def is_valid_move(self, position):
+        """Inside the board and not an obstacle, in O(1)."""
+        return (
+            0 <= position[0] < self.size and 0 <= position[1] < self.size
+            and not self.cells[self.cell_id(position)]
+        )
+
+    def set_wall(self, position, blocked=True):
+        """Add or remove an obstacle; returns the cell id that changed."""
+        cell = self.cell_id(position)
+        self.cells[cell] = WALL if blocked else FREE
+        self.version += 1
+        return cell
+
+    def neighbors(self, cell):
+        cells = self.cells
+        result = []
+        for offset in self.offsets:  # Bucle simple: más rápido que una comprensión con generador
+            neighbor = cell + offset
+            if not cells[neighbor]:
+                result.append(neighbor)
+        return result
+
+    def obstacles(self):
+        """Positions of the obstacles inside the board."""
+        cells = self.cells
+        for row in range(self.size):
+            start = (row + 1) * self.width + 1
+            for col in range(self.size):
+                if cells[start + col]:
+                    yield (row, col)
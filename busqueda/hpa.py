@@ -0,0 +1,298 @@
+"""Hierarchical pathfinding (HPA*) over square clusters of a Grid."""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from .grid import Grid
+from .search import INF, SearchResult
+from .stats import finish
+
+# Entradas de al menos este largo se representan con sus dos extremos
+LONG_ENTRANCE = 6
+
+
+class HierarchicalPlanner:
+    """HPA* planner: an abstract graph of cluster entrances, refined locally.
+
+    The board is cut into ``cluster_size`` x ``cluster_size`` clusters.
+    Every run of free cells along the border of two clusters is an
+    entrance, represented by one transition in its middle (or one at each
+    end when it is long); the two cells of a transition are abstract nodes
+    joined by an edge of cost 1.  Inside a cluster, nodes are joined by
+    their exact distance within the cluster, computed once.
+
+    A query connects start and goal to the nodes of their clusters, runs A*
+    on the abstract graph and expands each abstract edge into cells with a
+    BFS confined to one cluster.  Paths are near-optimal: they only leave
+    a cluster through its entrances.  ``set_wall`` rebuilds just the
+    cluster of the cell and, for cells on a border, the cluster across it.
+    """
+
+    def __init__(self, board, cluster_size=16):
+        self.grid = getattr(board, 'grid', board)
+        self.cluster_size = cluster_size
+        self.clusters_per_side = -(-self.grid.size // cluster_size)
+        self.rebuild()
+
+    def rebuild(self):
+        """Build the whole abstract graph from scratch."""
+        self.transitions = {}  # Borde (clúster, clúster) -> [(celda de un lado, celda del otro)]
+        self.inter = {}  # Nodo -> nodos de otros clústeres a un paso
+        self.intra = {}  # Clúster -> {nodo: {nodo: distancia dentro del clúster}}
+        self._local = {}
+        self.rebuilt = 0
+        n = self.clusters_per_side
+        for cr in range(n):
+            for cc in range(n):
+                if cc + 1 < n:
+                    self._build_border(((cr, cc), (cr, cc + 1)))
+                if cr + 1 < n:
+                    self._build_border(((cr, cc), (cr + 1, cc)))
+        for cr in range(n):
+            for cc in range(n):
+                self._build_cluster((cr, cc))
+        self.version = self.grid.version
+
+    def cluster_of(self, position):
+        return (position[0] // self.cluster_size, position[1] // self.cluster_size)
+
+    def _bounds(self, cluster):
+        size, step = self.grid.size, self.cluster_size
+        r0, c0 = cluster[0] * step, cluster[1] * step
+        return r0, min(r0 + step, size), c0, min(c0 + step, size)
+
+    def _borders(self, cluster):
+        """(border key, side of ``cluster`` in it) of the existing borders of a cluster."""
+        cr, cc = cluster
+        n = self.clusters_per_side
+        borders = []
+        if cc > 0:
+            borders.append((((cr, cc - 1), cluster), 1))
+        if cc + 1 < n:
+            borders.append(((cluster, (cr, cc + 1)), 0))
+        if cr > 0:
+            borders.append((((cr - 1, cc), cluster), 1))
+        if cr + 1 < n:
+            borders.append(((cluster, (cr + 1, cc)), 0))
+        return borders
+
+    def _build_border(self, key):
+        inter = self.inter
+        for a, b in self.transitions.pop(key, ()):
+            for cell, other in ((a, b), (b, a)):
+                inter[cell].discard(other)
+                if not inter[cell]:
+                    del inter[cell]
+
+        grid = self.grid
+        r0, r1, c0, c1 = self._bounds(key[0])
+        if key[1][1] > key[0][1]:
+            pairs = [((r, c1 - 1), (r, c1)) for r in range(r0, r1)]  # Borde vertical
+        else:
+            pairs = [((r1 - 1, c), (r1, c)) for c in range(c0, c1)]  # Borde horizontal
+
+        # Tramos contiguos de pares libres a ambos lados
+        runs, run = [], []
+        for a, b in pairs:
+            if grid.is_valid_move(a) and grid.is_valid_move(b):
+                run.append((grid.cell_id(a), grid.cell_id(b)))
+            elif run:
+                runs.append(run)
+                run = []
+        if run:
+            runs.append(run)
+
+        transitions = []
+        for run in runs:
+            transitions.extend([run[0], run[-1]] if len(run) >= LONG_ENTRANCE else [run[len(run) // 2]])
+        for a, b in transitions:
+            inter.setdefault(a, set()).add(b)
+            inter.setdefault(b, set()).add(a)
+        self.transitions[key] = transitions
+
+    def _mapping(self, cluster):
+        """(local Grid, to_local, to_global) for ``cluster``, cached until it is rebuilt."""
+        if cluster not in self._local:
+            r0, r1, c0, c1 = self._bounds(cluster)
+            local = Grid(self.cluster_size)
+            # Los clústeres del borde pueden ser rectangulares: el resto queda como pared
+            occupancy = np.ones((self.cluster_size, self.cluster_size), dtype=np.uint8)
+            occupancy[:r1 - r0, :c1 - c0] = self.grid.occupancy()[r0:r1, c0:c1]
+            local.set_occupancy(occupancy)
+            width, local_width = self.grid.width, local.width
+
+            def to_local(cell):
+                row, col = divmod(cell, width)
+                return (row - r0) * local_width + col - c0
+
+            def to_global(cell):
+                row, col = divmod(cell, local_width)
+                return (row + r0) * width + col + c0
+
+            self._local[cluster] = local, to_local, to_global
+        return self._local[cluster]
+
+    def _bfs(self, cluster, source, target=None):
+        """BFS confined to ``cluster`` from a global cell id; returns local (distances, parents)."""
+        local, to_local, to_global = self._mapping(cluster)
+        source = to_local(source)
+        target = None if target is None else to_local(target)
+        cells, offsets = local.cells, local.offsets
+        dist = {source: 0}
+        parents = {source: None}
+        queue = deque([source])
+        while queue and target not in dist:
+            cell = queue.popleft()
+            step = dist[cell] + 1
+            for offset in offsets:
+                n = cell + offset
+                if not cells[n] and n not in dist:
+                    dist[n] = step
+                    parents[n] = cell
+                    queue.append(n)
+        return dist, parents
+
+    def _distances(self, cluster, source, targets):
+        """Distances inside ``cluster`` from ``source`` to the reachable ``targets``."""
+        _, to_local, _ = self._mapping(cluster)
+        dist, _ = self._bfs(cluster, source)
+        return {t: dist[to_local(t)] for t in targets if to_local(t) in dist}
+
+    def _path(self, cluster, source, target):
+        """Cells from ``source`` to ``target`` inside ``cluster`` as positions, or None."""
+        _, to_local, to_global = self._mapping(cluster)
+        _, parents = self._bfs(cluster, source, target)
+        cell = to_local(target)
+        if cell not in parents:
+            return None
+        cells = []
+        while cell is not None:
+            cells.append(to_global(cell))
+            cell = parents[cell]
+        return [self.grid.position(c) for c in reversed(cells)]
+
+    def _nodes(self, cluster):
+        nodes = set()
+        for key, side in self._borders(cluster):
+            nodes.update(pair[side] for pair in self.transitions.get(key, ()))
+        return nodes
+
+    def _build_cluster(self, cluster):
+        self._local.pop(cluster, None)
+        nodes = self._nodes(cluster)
+        edges = {}
+        for node in nodes:
+            edges[node] = self._distances(cluster, node, nodes - {node})
+        self.intra[cluster] = edges
+        self.rebuilt += 1
+
+    def set_wall(self, position, blocked=True):
+        """Add or remove an obstacle and rebuild only the clusters it touches."""
+        self.grid.set_wall(position, blocked)
+        cluster = self.cluster_of(position)
+        r0, r1, c0, c1 = self._bounds(cluster)
+        row, col = position
+        affected = {cluster}
+        for key, side in self._borders(cluster):
+            other = key[1 - side]
+            on_edge = (
+                (other[1] < cluster[1] and col == c0) or (other[1] > cluster[1] and col == c1 - 1)
+                or (other[0] < cluster[0] and row == r0) or (other[0] > cluster[0] and row == r1 - 1)
+            )
+            if on_edge:
+                self._build_border(key)
+                affected.add(other)
+        for each in affected:
+            self._build_cluster(each)
+        self.version = self.grid.version
+
+    def _cluster_of_cell(self, cell):
+        row, col = divmod(cell, self.grid.width)
+        return ((row - 1) // self.cluster_size, (col - 1) // self.cluster_size)
+
+    def search(self, start, goal, stats=None):
+        """Path from ``start`` to ``goal`` (positions) as a SearchResult.
+
+        ``expanded`` counts the abstract nodes popped by A*; the cells
+        visited by the local BFS runs are not included.
+        """
+        if stats is not None:
+            stats.start()
+        if self.version != self.grid.version:
+            self.rebuild()  # El tablero cambió sin pasar por set_wall
+        grid = self.grid
+        if not grid.is_valid_move(start) or not grid.is_valid_move(goal):
+            return finish(stats, SearchResult(False, [], None, 0), 0, 0)
+        source, target = grid.cell_id(start), grid.cell_id(goal)
+        start_cluster, goal_cluster = self.cluster_of(start), self.cluster_of(goal)
+
+        if start_cluster == goal_cluster:
+            path = self._path(start_cluster, source, target)
+            if path is not None:
+                return finish(stats, SearchResult(True, path, len(path) - 1, 0), 0, 0)
+
+        # Conectar inicio y meta a los nodos de su clúster
+        start_edges = self._distances(start_cluster, source, self._nodes(start_cluster))
+        goal_edges = self._distances(goal_cluster, target, self._nodes(goal_cluster))
+
+        goal_row, goal_col = divmod(target, grid.width)
+
+        def heuristic(cell):
+            row, col = divmod(cell, grid.width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        h = heuristic(source)
+        frontier = [(h, h, 0, source)]
+        best_g = {source: 0}
+        parents = {source: None}
+        counter = expanded = peak = 0
+
+        while frontier:
+            if stats is not None and len(frontier) > peak:
+                peak = len(frontier)
+            f, h, _, cell = heapq.heappop(frontier)
+            cost = best_g[cell]
+            if f > cost + h:
+                continue
+            if cell == target:
+                path = self._refine(parents, target)
+                return finish(stats, SearchResult(True, path, cost, expanded), counter, peak, best_g)
+            expanded += 1
+
+            if cell == source:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intra[self._cluster_of_cell(cell)].get(cell, {}).items())
+            edges.extend((n, 1) for n in self.inter.get(cell, ()))
+            if cell in goal_edges:
+                edges.append((target, goal_edges[cell]))
+
+            for neighbor, step in edges:
+                new_cost = cost + step
+                if new_cost < best_g.get(neighbor, INF):
+                    best_g[neighbor] = new_cost
+                    parents[neighbor] = cell
+                    h = heuristic(neighbor)
+                    counter += 1
+                    heapq.heappush(frontier, (new_cost + h, h, counter, neighbor))
+
+        return finish(stats, SearchResult(False, [], None, expanded), counter, peak, best_g)
+
+    def _refine(self, parents, target):
+        """Expand the abstract path into cells, one cluster-local BFS per abstract edge."""
+        abstract = []
+        cell = target
+        while cell is not None:
+            abstract.append(cell)
+            cell = parents[cell]
+        abstract.reverse()
+
+        path = [self.grid.position(abstract[0])]
+        for a, b in zip(abstract, abstract[1:]):
+            if b in self.inter.get(a, ()):
+                path.append(self.grid.position(b))  # Transición entre clústeres
+                continue
+            path.extend(self._path(self._cluster_of_cell(a), a, b)[1:])
+        return path
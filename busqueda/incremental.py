@@ -0,0 +1,173 @@
+"""Incremental replanning for Piggy with D* Lite."""
+
+import heapq
+
+from .search import SearchResult
+from .stats import finish
+
+INF = float('inf')
+
+
+class DStarLite:
+    """D* Lite planner that keeps its g/rhs tables between turns.
+
+    The search is rooted at the target (René) and answers the shortest path
+    from the pursuer (Piggy).  When Piggy moves only ``km`` changes; when
+    René or a wall moves, the cells whose rhs changed are put back in the
+    open list and ``compute_shortest_path`` repairs just that region.
+    Moving the root is handled as a change of the cost of the edges from a
+    virtual source to the old and new root, so the usual D* Lite guarantees
+    still hold.
+    """
+
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = grid.cell_id(start)
+        self.goal = grid.cell_id(goal)
+        self.last = self.start
+        self.km = 0
+        self.g = {}
+        self.root_value = 0  # rhs de la raíz; los costos se miden desde aquí
+        self.rhs = {self.goal: self.root_value}
+        self.path_cells = []  # Último camino devuelto, como celdas
+        self.open = {}  # Celda -> clave vigente (borrado perezoso en el montículo)
+        self.heap = []
+        self.expanded = 0
+        self.generated = 0  # Entradas metidas al montículo
+        self._push(self.goal)
+
+    def _h(self, a, b):
+        ar, ac = divmod(a, self.grid.width)
+        br, bc = divmod(b, self.grid.width)
+        return abs(ar - br) + abs(ac - bc)
+
+    def _key(self, cell):
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return (best + self._h(self.start, cell) + self.km, best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self.open[cell] = key
+        self.generated += 1
+        heapq.heappush(self.heap, (key, cell))
+
+    def _top(self):
+        heap, open_keys = self.heap, self.open
+        while heap:
+            key, cell = heap[0]
+            if open_keys.get(cell) == key:
+                return key, cell
+            heapq.heappop(heap)  # Entrada obsoleta
+        return (INF, INF), None
+
+    def _update_vertex(self, cell):
+        g = self.g
+        if cell != self.goal:
+            if self.grid.cells[cell]:
+                self.rhs[cell] = INF  # Las paredes no tienen camino
+            else:
+                self.rhs[cell] = min((g.get(n, INF) for n in self.grid.neighbors(cell)), default=INF) + 1
+        if g.get(cell, INF) != self.rhs.get(cell, INF):
+            self._push(cell)
+        else:
+            self.open.pop(cell, None)
+
+    def compute_shortest_path(self):
+        g, rhs, neighbors = self.g, self.rhs, self.grid.neighbors
+        while True:
+            key, cell = self._top()
+            start = self.start
+            if cell is None:
+                break
+            if not (key < self._key(start) or rhs.get(start, INF) != g.get(start, INF)):
+                break
+
+            new_key = self._key(cell)
+            if key < new_key:
+                self._push(cell)  # La clave quedó vieja por km
+                continue
+
+            heapq.heappop(self.heap)
+            del self.open[cell]
+            self.expanded += 1
+
+            if g.get(cell, INF) > rhs.get(cell, INF):
+                g[cell] = rhs[cell]
+                for n in neighbors(cell):
+                    self._update_vertex(n)
+            else:
+                g[cell] = INF
+                self._update_vertex(cell)
+                for n in neighbors(cell):
+                    self._update_vertex(n)
+
+    def move_start(self, position):
+        """Piggy moved: only the key modifier changes."""
+        cell = self.grid.cell_id(position)
+        if cell != self.start:
+            self.km += self._h(self.last, cell)
+            self.last = self.start = cell
+
+    def move_goal(self, position):
+        """René moved: swap the root and mark both cells for repair.
+
+        The root keeps a value (``root_value``) instead of 0, so every g is
+        a distance plus a constant.  The new root's value is chosen so that
+        the g-values between René and Piggy stay consistent, which leaves
+        only the cells behind René to repair.
+        """
+        cell = self.grid.cell_id(position)
+        if cell == self.goal:
+            return
+        old_goal, self.goal = self.goal, cell
+
+        if self.path_cells and len(self.path_cells) > 1 and self.path_cells[-2] == cell:
+            shift = 1  # René avanzó por el camino hacia Piggy
+        else:
+            shift = self._h(old_goal, self.start) - self._h(cell, self.start)
+        self.root_value += shift
+
+        self.rhs[cell] = self.root_value
+        self._update_vertex(cell)
+        self._update_vertex(old_goal)
+
+    def set_wall(self, position, blocked=True):
+        """Add or remove an obstacle and repair the cells next to it."""
+        cell = self.grid.set_wall(position, blocked)
+        self._update_vertex(cell)
+        for n in self.grid.neighbors(cell):
+            self._update_vertex(n)
+
+    def search(self, start=None, goal=None, stats=None):
+        """Repair the tables and return the current path from Piggy to René.
+
+        ``expanded`` in the result only counts the work done by this call,
+        and so does the optional SearchStats collector ``stats``.
+        """
+        if stats is not None:
+            stats.start()
+        generated = self.generated
+        if start is not None:
+            self.move_start(start)
+        if goal is not None:
+            self.move_goal(goal)
+
+        before = self.expanded
+        self.compute_shortest_path()
+        expanded = self.expanded - before
+
+        g, grid = self.g, self.grid
+        if g.get(self.start, INF) == INF:
+            self.path_cells = []
+            return finish(stats, SearchResult(False, [], None, expanded), self.generated - generated, len(self.heap), g, self.rhs)
+
+        # Seguir el gradiente de g desde Piggy hasta René
+        cell = self.start
+        path_cells = [cell]
+        while cell != self.goal:
+            cell = min(grid.neighbors(cell), key=lambda n: g.get(n, INF))
+            path_cells.append(cell)
+        self.path_cells = path_cells
+        cost = g[self.start] - self.root_value
+        result = SearchResult(True, [grid.position(c) for c in path_cells], cost, expanded)
+        return finish(stats, result, self.generated - generated, len(self.heap), g, self.rhs)
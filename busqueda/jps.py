@@ -0,0 +1,111 @@
+"""Jump Point Search for uniform-cost 4-connected grids."""
+
+import heapq
+
+from .search import INF, SearchResult
+from .stats import finish
+
+
+def _jump(grid, cell, direction, goal):
+    """Walk from ``cell`` in ``direction`` until a jump point, or None if blocked.
+
+    Moving horizontally, a jump point is a cell with a forced neighbor above
+    or below it.  Moving vertically, it is a cell with a forced neighbor to
+    a side, or any cell from which a horizontal jump finds a jump point.
+    """
+    cells, width = grid.cells, grid.width
+    horizontal = direction in (1, -1)
+    sides = (width, -width) if horizontal else (1, -1)
+
+    while True:
+        cell += direction
+        if cells[cell]:
+            return None
+        if cell == goal:
+            return cell
+
+        for side in sides:
+            if not cells[cell + side] and cells[cell - direction + side]:
+                return cell  # Vecino forzado
+
+        if not horizontal and (_jump(grid, cell, 1, goal) is not None
+                               or _jump(grid, cell, -1, goal) is not None):
+            return cell
+
+
+def jump_point_search(problem, stats=None):
+    """A* over jump points for a GridProblem; same costs as astar_search.
+
+    Straight runs of symmetric moves are skipped by ``_jump`` so only jump
+    points enter the heap.  ``expanded`` counts the jump points popped from
+    the heap.  ``stats`` is an optional SearchStats collector.  Problems
+    with a CSRGraph are rejected: the jumps assume 4-connected unit steps.
+    """
+    if problem.graph is not None:
+        raise ValueError("jump_point_search no admite un CSRGraph: solo recorre la cuadrícula 4-conexa de costo 1")
+
+    if stats is not None:
+        stats.start()
+    grid = problem.grid
+    width = grid.width
+    start, goal = problem.start, problem.goal
+    heuristic = problem.heuristic
+
+    h = heuristic(start)
+    frontier = [(h, h, 0, start, 0)]  # Montículo: (f, h, desempate, celda, dirección de llegada)
+    best_g = {start: 0}
+    parents = {start: None}
+    counter = 0
+    expanded = 0
+    peak = 0
+
+    while frontier:
+        if stats is not None and len(frontier) > peak:
+            peak = len(frontier)
+        f, h, _, cell, direction = heapq.heappop(frontier)
+        cost = best_g[cell]
+        if f > cost + h:
+            continue  # Entrada obsoleta
+
+        if cell == goal:
+            result = SearchResult(True, _expand_path(grid, parents, cell), cost, expanded)
+            return finish(stats, result, counter, peak, best_g, parents)
+
+        expanded += 1
+        if direction == 0:
+            directions = grid.offsets  # Desde el inicio se prueba todo
+        elif direction in (1, -1):
+            directions = (direction, width, -width)
+        else:
+            directions = (direction, 1, -1)
+
+        for new_direction in directions:
+            jump_point = _jump(grid, cell, new_direction, goal)
+            if jump_point is None:
+                continue
+            new_cost = cost + abs(jump_point - cell) // abs(new_direction)
+            if new_cost < best_g.get(jump_point, INF):
+                best_g[jump_point] = new_cost
+                parents[jump_point] = cell
+                h = heuristic(jump_point)
+                counter += 1
+                heapq.heappush(frontier, (new_cost + h, h, counter, jump_point, new_direction))
+
+    return finish(stats, SearchResult(False, [], None, expanded), counter, peak, best_g, parents)
+
+
+def _expand_path(grid, parents, cell):
+    """Fill in the straight segments between consecutive jump points."""
+    jump_points = []
+    while cell is not None:
+        jump_points.append(cell)
+        cell = parents[cell]
+    jump_points.reverse()
+
+    path = [grid.position(jump_points[0])]
+    for a, b in zip(jump_points, jump_points[1:]):
+        step = 1 if abs(b - a) < grid.width else grid.width
+        step = step if b > a else -step
+        for cell in range(a + step, b + step, step):
+            path.append(grid.position(cell))
+    return path
@@ -0,0 +1,91 @@
+"""ALT heuristics: lower bounds from precomputed landmark distance fields."""
+
+import numpy as np
+
+from .distance import UNREACHABLE, wavefront
+from .grid import FREE
+from .search import INF
+
+
+class Landmarks:
+    """K landmark cells of a Grid (or Board) and their BFS distance fields.
+
+    Landmarks are chosen by farthest-point sampling, so they end up on the
+    edges and dead ends of the board where they bound the most routes.
+    By the triangle inequality ``|d(L, a) - d(L, b)|`` never exceeds the
+    distance from ``a`` to ``b``, so the largest of these differences (and
+    the Manhattan distance) is an admissible heuristic for unit-cost,
+    4-connected searches.
+
+    The fields are stored as one ``count`` x cells array of uint16, or
+    uint32 on boards whose distances do not fit, with the type's maximum
+    marking unreachable cells.  ``lower_bound`` has the ``heuristic_fn``
+    signature over cell ids; ``position_bound`` takes positions.  Like a
+    CSRGraph, the landmarks are a snapshot: rebuild them when ``stale``
+    says the grid changed.
+    """
+
+    def __init__(self, board, count=8, seed=0):
+        grid = getattr(board, 'grid', board)
+        self.grid = grid
+        self.version = grid.version
+
+        free = np.frombuffer(grid.cells, dtype=np.uint8) == FREE
+        cells = np.flatnonzero(free)
+        nearest = np.where(free, np.iinfo(np.int64).max, -1)  # Distancia al landmark más cercano
+        landmarks, fields = [], []
+        if cells.size:
+            # El primero es la celda más lejana de una celda libre al azar
+            first = wavefront(grid, int(np.random.default_rng(seed).choice(cells)))
+            candidate = int(np.argmax(first))
+            while len(landmarks) < count and nearest[candidate] > 0:
+                dist = wavefront(grid, candidate)
+                landmarks.append(candidate)
+                fields.append(dist)
+                reached = dist != UNREACHABLE
+                nearest[reached] = np.minimum(nearest[reached], dist[reached])
+                candidate = int(np.argmax(nearest))
+
+        farthest = max((int(dist.max()) for dist in fields), default=0)
+        dtype = np.uint16 if farthest < np.iinfo(np.uint16).max else np.uint32
+        self.unreachable = int(np.iinfo(dtype).max)
+        self.fields = np.full((len(fields), len(grid.cells)), self.unreachable, dtype=dtype)
+        for row, dist in zip(self.fields, fields):
+            reached = dist != UNREACHABLE
+            row[reached] = dist[reached]
+        self.landmarks = [grid.position(cell) for cell in landmarks]
+        self._rows = [memoryview(row) for row in self.fields]  # Acceso rápido desde Python
+
+    def lower_bound(self, cell, goal):
+        """Admissible estimate of the steps between cell ids ``cell`` and ``goal``."""
+        width = self.grid.width
+        row, col = divmod(cell, width)
+        goal_row, goal_col = divmod(goal, width)
+        best = abs(row - goal_row) + abs(col - goal_col)
+        unreachable = self.unreachable
+        for field in self._rows:
+            a, b = field[cell], field[goal]
+            if a == unreachable or b == unreachable:
+                if a != b:
+                    return INF  # Solo una de las dos celdas llega a este landmark
+                continue
+            if a - b > best:
+                best = a - b
+            elif b - a > best:
+                best = b - a
+        return best
+
+    def position_bound(self, position, goal):
+        """``lower_bound`` for (row, col) positions, as a Problem ``heuristic_fn``."""
+        return self.lower_bound(self.grid.cell_id(position), self.grid.cell_id(goal))
+
+    @property
+    def stale(self):
+        return self.version != self.grid.version
+
+    @property
+    def nbytes(self):
+        return self.fields.nbytes
+
+    def __len__(self):
+        return len(self.landmarks)
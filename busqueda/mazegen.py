@@ -0,0 +1,164 @@
+"""Seeded generators of large boards for load and performance testing.
+
+Every generator returns a Grid, the same occupancy format the searches
+consume.  Mazes carve rooms on even (row, col) positions and open the
+wall between two rooms when they are joined, so every free cell is
+reachable from (0, 0).
+"""
+
+import random
+
+import numpy as np
+
+from .grid import Grid
+
+_OUTSIDE = 2  # Marca del borde doble que rodea el tablero al tallar
+
+
+def _blank_maze(size):
+    """All-wall board padded with a two-cell border, so room steps of ±2 never leave it."""
+    width = size + 4
+    cells = bytearray([_OUTSIDE]) * (width * width)
+    for row in range(2, size + 2):
+        cells[row * width + 2:row * width + 2 + size] = b'\x01' * size
+    return cells, width
+
+
+def _to_grid(cells, width):
+    board = np.frombuffer(cells, dtype=np.uint8).reshape(width, width)[2:-2, 2:-2]
+    return Grid.from_occupancy(board)
+
+
+def recursive_backtracker(size, seed=0):
+    """Perfect maze carved by a depth-first walk with an explicit stack."""
+    rand = random.Random(seed).random
+    cells, width = _blank_maze(size)
+    steps = (2, -2, 2 * width, -2 * width)
+    start = 2 * width + 2
+    cells[start] = 0
+    stack = [start]
+
+    while stack:
+        cell = stack[-1]
+        options = [step for step in steps if cells[cell + step] == 1]
+        if not options:
+            stack.pop()  # Sin salida: retroceder
+            continue
+        step = options[int(rand() * len(options))]
+        cells[cell + step] = 0
+        cells[cell + (step >> 1)] = 0  # Abrir la pared entre las dos salas
+        stack.append(cell + step)
+
+    return _to_grid(cells, width)
+
+
+def prim(size, seed=0):
+    """Perfect maze grown by randomized Prim: join a random frontier room to the maze."""
+    rand = random.Random(seed).random
+    cells, width = _blank_maze(size)
+    steps = (2, -2, 2 * width, -2 * width)
+    in_frontier = 3
+    frontier = []
+
+    def add_frontier(cell):
+        for step in steps:
+            if cells[cell + step] == 1:
+                cells[cell + step] = in_frontier
+                frontier.append(cell + step)
+
+    start = 2 * width + 2
+    cells[start] = 0
+    add_frontier(start)
+
+    while frontier:
+        # Sacar una sala al azar en O(1): se cambia por la última
+        index = int(rand() * len(frontier))
+        cell = frontier[index]
+        frontier[index] = frontier[-1]
+        frontier.pop()
+
+        carved = [step for step in steps if cells[cell + step] == 0]
+        step = carved[int(rand() * len(carved))]
+        cells[cell] = 0
+        cells[cell + (step >> 1)] = 0
+        add_frontier(cell)
+
+    return _to_grid(cells, width)
+
+
+def _regions(grid):
+    """Connected-region label of every cell id: the smallest cell id of its region.
+
+    One vectorized union-find over all the edges between free cells: each
+    round hooks every root onto the smallest root joined to it by an edge,
+    then compresses the parents with pointer jumping.  Walls keep their own
+    id as label.
+    """
+    free = np.frombuffer(grid.cells, dtype=np.uint8) == 0
+    cells = np.flatnonzero(free)
+    sources, targets = [], []
+    for offset in (1, grid.width):  # Cada arista una sola vez: derecha y abajo
+        joined = free[cells + offset]
+        sources.append(cells[joined])
+        targets.append(cells[joined] + offset)
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+
+    parent = np.arange(len(free), dtype=np.int64)
+    while sources.size:
+        roots_a, roots_b = parent[sources], parent[targets]
+        apart = roots_a != roots_b
+        sources, targets = sources[apart], targets[apart]
+        roots_a, roots_b = roots_a[apart], roots_b[apart]
+        # La raíz mayor cuelga de la menor: los padres solo bajan y no hay ciclos
+        np.minimum.at(parent, np.maximum(roots_a, roots_b), np.minimum(roots_a, roots_b))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    return parent
+
+
+def random_fill(size, density=0.3, seed=0, keep=None):
+    """Random walls with the given density, keeping a single connected region.
+
+    Cells outside the largest connected region become walls.  With a
+    ``keep`` position, that cell is left free and its region is kept
+    instead, even if it is not the largest.
+    """
+    rng = np.random.default_rng(seed)
+    occupancy = rng.random((size, size)) < density
+    if keep is not None:
+        occupancy[keep] = False
+    grid = Grid.from_occupancy(occupancy)
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+
+    labels = _regions(grid)
+    if keep is not None:
+        label = labels[grid.cell_id(keep)]
+    else:
+        counts = np.bincount(labels[cells == 0], minlength=len(cells))
+        label = int(np.argmax(counts))
+
+    grid.set_occupancy((labels != label).reshape(grid.width, grid.width)[1:-1, 1:-1])
+    return grid
+
+
+GENERATORS = {
+    'backtracker': recursive_backtracker,
+    'prim': prim,
+    'random': random_fill,
+}
+
+
+def generate(kind, size, seed=0, **options):
+    """Board from the generator registered under ``kind`` in GENERATORS."""
+    return GENERATORS[kind](size, seed=seed, **options)
+
+
+def free_positions(grid, count, seed=0):
+    """``count`` distinct free positions chosen at random, e.g. to place the agents."""
+    rng = np.random.default_rng(seed)
+    free = np.flatnonzero(grid.occupancy() == 0)
+    chosen = rng.choice(free, size=count, replace=False)
+    return [divmod(int(index), grid.size) for index in chosen]
@@ -0,0 +1,122 @@
+"""Headless pursuit of several Renés by several Piggies on one board."""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import PathCache
+from .cookie import CookieSolver
+from .distance import distance_field, gradient_step
+from .game import DRAW, PIGGY, RENE, config_grid, rene_step
+from .stats import SearchStats
+
+PursuitConfig = namedtuple(
+    'PursuitConfig',
+    ['size', 'renes', 'elmo', 'galleta', 'piggies', 'depth_limit', 'obstacles', 'max_turns'],
+    defaults=((), 1000),
+)
+
+
+class PursuitGame:
+    """M Renés run to Elmo while N Piggies chase them, one step each per turn.
+
+    Every René plays as in Game: IDA* towards Elmo with the CookieSolver
+    heuristic.  They all share one transposition table and the cache,
+    since their problems only differ in the start.
+
+    Piggies do not plan one by one.  Each turn one distance field is
+    computed per René still on the board (through the cache, so Renés on
+    the same cell share it); every Piggy reads its distance to each René
+    from those fields, picks the nearest one and steps down that field's
+    gradient.  The cost of a turn grows with the number of Renés, not of
+    Piggies.
+
+    A René leaves the board when it reaches Elmo (``escaped``) or a Piggy
+    lands on its cell (``caught``); removed Renés keep their index with
+    position None.  When no René is left, whichever side has more wins and
+    a tie is a draw.  It is also a draw if nobody moves or the turns run out.
+    """
+
+    def __init__(self, config, cache=None, collect_stats=False):
+        self.config = config
+        self.cache = cache if cache is not None else PathCache()
+        self.grid = config_grid(config)
+        self.solver = CookieSolver(self.grid, config.elmo, [config.galleta])
+        self.rene_table = {}  # Compartida: las cotas no dependen del René que las aprendió
+        self.collect_stats = collect_stats
+        self.turn_stats = None
+
+        self.renes = list(config.renes)
+        self.piggies = list(config.piggies)
+        self.has_galleta = [False] * len(self.renes)
+        self.rene_costs = [0] * len(self.renes)
+        self.escaped = []
+        self.caught = []
+        self.piggy_moves = 0
+        self.fields = 0  # Campos de distancia calculados en el último turno
+        self.turns = 0
+        self.expansions = 0
+        self.winner = None
+
+    def _field(self, position, stats):
+        field = self.cache.lookup(self.grid, 'distance_field', position)
+        if field is None:
+            field = distance_field(self.grid, position, stats)
+            self.expansions += int(np.count_nonzero(field >= 0))
+            field.flags.writeable = False  # Lo leen todos los Piggies y otras partidas con la misma caché
+            self.cache.store(self.grid, 'distance_field', position, field)
+            self.fields += 1
+        return field
+
+    def turn(self):
+        """Play one turn: every René, then every Piggy, moves one step."""
+        config = self.config
+        rene_stats = piggy_stats = None
+        if self.collect_stats:
+            rene_stats, piggy_stats = SearchStats(), SearchStats()
+            self.turn_stats = {'rene': rene_stats, 'piggy': piggy_stats}
+        moved = False
+
+        # Movimiento de los Renés (IDA* hacia Elmo)
+        for index, position in enumerate(self.renes):
+            if position is None:
+                continue
+            _, position, self.has_galleta[index], cost = rene_step(self, position, self.has_galleta[index], rene_stats)
+            if cost:
+                moved = True
+                self.rene_costs[index] += cost
+                self.renes[index] = position
+            if position == config.elmo:
+                self.escaped.append(index)
+                self.renes[index] = None
+
+        self.turns += 1
+
+        # Un campo de distancias por René en el tablero, compartido por todos los Piggies
+        self.fields = 0
+        fields = [self._field(position, piggy_stats) for position in self.renes if position is not None]
+        for index, position in enumerate(self.piggies):
+            target, best = None, None
+            for field in fields:
+                dist = field[position]
+                if dist >= 0 and (best is None or dist < best):
+                    target, best = field, dist
+            if target is None:
+                continue  # Ningún René alcanzable
+            next_pos = gradient_step(target, position)
+            if next_pos != position:
+                moved = True
+                self.piggy_moves += 1
+                self.piggies[index] = next_pos
+
+        occupied = set(self.piggies)
+        for index, position in enumerate(self.renes):
+            if position is not None and position in occupied:
+                self.caught.append(index)
+                self.renes[index] = None
+
+        if all(position is None for position in self.renes):
+            escaped, caught = len(self.escaped), len(self.caught)
+            self.winner = RENE if escaped > caught else PIGGY if caught > escaped else DRAW
+        elif not moved or self.turns >= config.max_turns:
+            self.winner = DRAW  # Nadie puede avanzar o se acabaron los turnos
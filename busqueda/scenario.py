@@ -0,0 +1,105 @@
+"""Binary scenario files: a fixed header followed by a bit-packed occupancy grid.
+
+Layout (little endian): the HEADER_DTYPE record, zero padding up to
+DATA_OFFSET, then ``ceil(size * size / 8)`` bytes with one bit per cell in
+row-major order (1 = obstacle, most significant bit first).  The grid is
+opened with ``np.memmap``, so loading only reads the header and the pages of
+the map that are actually touched.
+"""
+
+import numpy as np
+
+from .grid import Grid
+
+MAGIC = b'LBRN'
+FORMAT_VERSION = 1
+DATA_OFFSET = 64
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('format', '<u4'),
+    ('size', '<u4'),
+    ('rene', '<u4', 2),
+    ('elmo', '<u4', 2),
+    ('galleta', '<u4', 2),
+    ('piggy', '<u4', 2),
+    ('depth_limit', '<u4'),
+    ('seed', '<i8'),
+])
+
+
+class Scenario:
+    """A scenario file opened read-only; the occupancy bits stay memory-mapped.
+
+    Pickling a Scenario only sends its path, so batch workers map the same
+    file (and share its pages) instead of receiving a copy of the board.
+    """
+
+    __slots__ = ('path', 'size', 'rene', 'elmo', 'galleta', 'piggy', 'depth_limit', 'seed', 'bits')
+
+    def __init__(self, path):
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if len(header) != 1 or header['magic'][0] != MAGIC:
+            raise ValueError(f"{path} no es un archivo de escenario")
+        if header['format'][0] != FORMAT_VERSION:
+            raise ValueError(f"{path}: versión de formato {header['format'][0]} no soportada")
+        header = header[0]
+
+        self.path = path
+        self.size = int(header['size'])
+        self.rene = tuple(int(v) for v in header['rene'])
+        self.elmo = tuple(int(v) for v in header['elmo'])
+        self.galleta = tuple(int(v) for v in header['galleta'])
+        self.piggy = tuple(int(v) for v in header['piggy'])
+        self.depth_limit = int(header['depth_limit'])
+        self.seed = int(header['seed'])
+        nbytes = (self.size * self.size + 7) // 8
+        self.bits = np.memmap(path, dtype=np.uint8, mode='r', offset=DATA_OFFSET, shape=(nbytes,))
+
+    def __reduce__(self):
+        return (Scenario, (self.path,))
+
+    def is_wall(self, position):
+        """Read a single cell straight from the mapped bits."""
+        index = position[0] * self.size + position[1]
+        return bool(self.bits[index >> 3] >> (7 - (index & 7)) & 1)
+
+    def occupancy(self, start=0, stop=None):
+        """Rows ``start:stop`` as a uint8 array (1 = obstacle), unpacking only their bytes."""
+        size = self.size
+        stop = size if stop is None else min(stop, size)
+        first, last = start * size, stop * size
+        chunk = np.unpackbits(self.bits[first >> 3:(last + 7) >> 3])
+        skip = first & 7
+        return chunk[skip:skip + last - first].reshape(stop - start, size)
+
+    def obstacles(self):
+        """Positions of the obstacles, as Board and Grid take them."""
+        rows, cols = np.nonzero(self.occupancy())
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def grid(self):
+        """Unpack the whole board into a Grid for the searches."""
+        return Grid.from_occupancy(self.occupancy())
+
+
+def save_scenario(path, board, rene, elmo, galleta, piggy, depth_limit, seed=0):
+    """Write a scenario; ``board`` is a Grid or a size x size array of obstacles."""
+    occupancy = board.occupancy() if isinstance(board, Grid) else np.asarray(board)
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = MAGIC
+    header['format'] = FORMAT_VERSION
+    header['size'] = occupancy.shape[0]
+    header['rene'], header['elmo'] = rene, elmo
+    header['galleta'], header['piggy'] = galleta, piggy
+    header['depth_limit'] = depth_limit
+    header['seed'] = seed
+
+    with open(path, 'wb') as f:
+        f.write(header.tobytes().ljust(DATA_OFFSET, b'\0'))
+        f.write(np.packbits(occupancy != 0, axis=None).tobytes())
+
+
+def load_scenario(path):
+    """Open a scenario file; see Scenario."""
+    return Scenario(path)
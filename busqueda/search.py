@@ -0,0 +1,557 @@
+"""Search algorithms shared by the labyrinth games."""
+
+import heapq
+import random
+from collections import deque, namedtuple
+
+from .stats import finish
+
+INF = float('inf')
+
+# Resultado común de todas las búsquedas
+SearchResult = namedtuple('SearchResult', ['found', 'path', 'cost', 'expanded'])
+
+
+class Problem:
+    """Search problem given by a start state, a goal state and a neighbors function.
+
+    ``neighbors_fn(state)`` returns the successor states, like the grid
+    example in BFS.PY.  Subclasses override ``step_cost``, ``heuristic``,
+    ``is_goal`` or ``decode`` when the plain version does not fit.
+    """
+
+    def __init__(self, start, goal, neighbors_fn, heuristic_fn=None):
+        self.start = start
+        self.goal = goal
+        self.neighbors_fn = neighbors_fn
+        self.heuristic_fn = heuristic_fn
+
+    def is_goal(self, state):
+        return state == self.goal
+
+    def neighbors(self, state):
+        return self.neighbors_fn(state)
+
+    def predecessors(self, state):
+        """States with an edge into ``state``; the graph is undirected by default."""
+        return self.neighbors(state)
+
+    def step_cost(self, state, next_state):
+        return 1  # Costo uniforme por defecto
+
+    @property
+    def unit_cost(self):
+        """True when every step costs 1, so a BFS layer number is the path cost."""
+        return type(self).step_cost is Problem.step_cost
+
+    def heuristic(self, state):
+        if self.heuristic_fn is None:
+            return 0
+        return self.heuristic_fn(state, self.goal)
+
+    def decode(self, state):
+        """Turn a state into the value reported in the path."""
+        return state
+
+    def reversed(self):
+        """Same problem searched from the goal back to the start."""
+        return Problem(self.goal, self.start, self.predecessors, self.heuristic_fn)
+
+
+class GridProblem(Problem):
+    """Shortest path between two positions of a Grid; states are cell ids.
+
+    With a CSRGraph ``graph`` the neighbors, step costs and heuristic come
+    from the compiled adjacency (8-connectivity, weighted edges).  A
+    ``heuristic_fn(cell, goal)`` over cell ids, such as
+    ``Landmarks.lower_bound``, replaces the Manhattan distance.  The
+    ``reversed`` problem charges each step the cost of the edge in the
+    original direction, so weights that depend on it stay correct.
+    """
+
+    def __init__(self, grid, start, goal, graph=None, heuristic_fn=None):
+        neighbors_fn = grid.neighbors if graph is None else graph.neighbors
+        super().__init__(grid.cell_id(start), grid.cell_id(goal), neighbors_fn, heuristic_fn)
+        self.grid = grid
+        self.graph = graph
+        self.start_pos = start
+        self.goal_pos = goal
+        self.backward = False
+
+    def step_cost(self, cell, next_cell):
+        if self.graph is None:
+            return 1
+        if self.backward:
+            return self.graph.step_cost(next_cell, cell)  # La arista real va de next_cell a cell
+        return self.graph.step_cost(cell, next_cell)
+
+    @property
+    def unit_cost(self):
+        return self.graph is None or self.graph.weights is None
+
+    def heuristic(self, cell):
+        if self.heuristic_fn is not None:
+            return self.heuristic_fn(cell, self.goal)
+        if self.graph is not None:
+            return self.graph.lower_bound(cell, self.goal)
+        # Distancia Manhattan hasta la meta
+        row, col = divmod(cell, self.grid.width)
+        return abs(row - 1 - self.goal_pos[0]) + abs(col - 1 - self.goal_pos[1])
+
+    def decode(self, cell):
+        return self.grid.position(cell)
+
+    def reversed(self):
+        problem = GridProblem(self.grid, self.goal_pos, self.start_pos, self.graph, self.heuristic_fn)
+        problem.backward = not self.backward
+        return problem
+
+
+class CookieProblem(Problem):
+    """René's problem: states are (cell, has_galleta) and steps cost half after the galleta."""
+
+    def __init__(self, grid, start, goal, galleta, has_galleta=False, heuristic_fn=None, graph=None):
+        neighbors_fn = grid.neighbors if graph is None else graph.neighbors
+        super().__init__((grid.cell_id(start), has_galleta), grid.cell_id(goal), neighbors_fn, heuristic_fn)
+        self.grid = grid
+        self.graph = graph
+        self.galleta = grid.cell_id(galleta)
+        self.goal_pos = goal
+
+    def is_goal(self, state):
+        return state[0] == self.goal
+
+    def neighbors(self, state):
+        cell, has_galleta = state
+        galleta = self.galleta
+        return [(n, has_galleta or n == galleta) for n in self.neighbors_fn(cell)]
+
+    def step_cost(self, state, next_state):
+        # Si ya tomó la galleta, cada paso cuesta la mitad
+        cost = 1 if self.graph is None else self.graph.step_cost(state[0], next_state[0])
+        return 0.5 * cost if state[1] else cost
+
+    def heuristic(self, state):
+        if self.heuristic_fn is not None:
+            return self.heuristic_fn(state, self.goal)
+        if self.graph is not None:
+            return 0.5 * self.graph.lower_bound(state[0], self.goal)
+        row, col = divmod(state[0], self.grid.width)
+        return 0.5 * (abs(row - 1 - self.goal_pos[0]) + abs(col - 1 - self.goal_pos[1]))
+
+    def decode(self, state):
+        return self.grid.position(state[0])
+
+    def reversed(self):
+        # La meta es cualquier estado sobre la celda de Elmo: no hay un único estado desde el que volver
+        raise TypeError("CookieProblem no se puede buscar hacia atrás: su meta es una celda, no un único estado")
+
+
+def reconstruct_path(parents, state, problem):
+    """Reconstruct the path by following parent states."""
+    path = []
+    while state is not None:
+        path.append(problem.decode(state))
+        state = parents[state]
+    return path[::-1]  # Camino desde el inicio hasta la meta
+
+
+def breadth_first_search(problem, stats=None):
+    """BFS uses a queue (FIFO) and expands all nodes at the current depth level first.
+
+    States are marked as seen when they are enqueued, so every state enters
+    the queue at most once and the goal is detected as soon as it is generated.
+    Problems with unit steps and the plain neighbors and goal test take the
+    leaner ``_unit_breadth_first_search``.  ``stats`` is an optional
+    SearchStats collector.
+    """
+    if stats is not None:
+        stats.start()
+    start = problem.start
+    parents = {start: None}  # También hace de conjunto de visitados
+    if problem.is_goal(start):
+        return finish(stats, SearchResult(True, reconstruct_path(parents, start, problem), 0, 0), 0, 1, parents)
+    if (problem.unit_cost and type(problem).neighbors is Problem.neighbors
+            and type(problem).is_goal is Problem.is_goal):
+        return _unit_breadth_first_search(problem, parents, stats)
+
+    frontier = deque([(start, 0)])  # Cola: (estado, costo), popleft en O(1)
+    neighbors, step_cost, is_goal = problem.neighbors, problem.step_cost, problem.is_goal
+    expanded = 0
+    peak = 0
+
+    while frontier:
+        if stats is not None and len(frontier) > peak:
+            peak = len(frontier)
+        state, cost = frontier.popleft()
+        expanded += 1
+
+        for neighbor in neighbors(state):
+            if neighbor in parents:
+                continue
+            parents[neighbor] = state
+            new_cost = cost + step_cost(state, neighbor)
+            if is_goal(neighbor):
+                result = SearchResult(True, reconstruct_path(parents, neighbor, problem), new_cost, expanded)
+                return finish(stats, result, len(parents) - 1, peak, parents)
+            frontier.append((neighbor, new_cost))
+
+    return finish(stats, SearchResult(False, [], None, expanded), len(parents) - 1, peak, parents)
+
+
+def _unit_breadth_first_search(problem, parents, stats):
+    """breadth_first_search for unit steps and plain neighbors and goal test.
+
+    The queue is walked one complete layer at a time, so the cost is the
+    layer number and no (state, cost) tuples are built; ``neighbors_fn`` and
+    the goal are used directly instead of through the Problem methods.  The
+    frontier of ``stats`` is the largest layer.
+    """
+    neighbors_fn, goal = problem.neighbors_fn, problem.goal
+    layer = [problem.start]
+    cost = 0
+    expanded = 0
+    peak = 0
+
+    while layer:
+        if len(layer) > peak:
+            peak = len(layer)
+        cost += 1
+        next_layer = []
+        append = next_layer.append
+        for state in layer:
+            expanded += 1
+            for neighbor in neighbors_fn(state):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = state
+                if neighbor == goal:
+                    result = SearchResult(True, reconstruct_path(parents, neighbor, problem), cost, expanded)
+                    return finish(stats, result, len(parents) - 1, peak, parents)
+                append(neighbor)
+        layer = next_layer
+
+    return finish(stats, SearchResult(False, [], None, expanded), len(parents) - 1, peak, parents)
+
+
+def astar_search(problem, stats=None):
+    """A* uses a priority queue (min-heap) based on f(n) = g(n) + h(n).
+
+    The heap holds compact (f, h, counter, state) tuples, so ties on f go to
+    the entry closer to the goal.  best_g keeps the cheapest known cost of
+    every state: worse duplicates are never pushed and stale entries are
+    skipped when they reach the top of the heap.  ``stats`` is an optional
+    SearchStats collector.
+    """
+    if stats is not None:
+        stats.start()
+    neighbors, step_cost, heuristic = problem.neighbors, problem.step_cost, problem.heuristic
+    is_goal = problem.is_goal
+    start = problem.start
+    h = heuristic(start)
+    frontier = [(h, h, 0, start)]  # Montículo: (f, h, desempate, estado)
+    best_g = {start: 0}
+    parents = {start: None}
+    counter = 0
+    expanded = 0
+    peak = 0
+
+    while frontier:
+        if stats is not None and len(frontier) > peak:
+            peak = len(frontier)
+        f, h, _, state = heapq.heappop(frontier)
+        cost = best_g[state]
+        if f > cost + h:
+            continue  # Entrada obsoleta: ya se encontró un camino mejor
+
+        if is_goal(state):
+            result = SearchResult(True, reconstruct_path(parents, state, problem), cost, expanded)
+            return finish(stats, result, counter, peak, best_g, parents)
+
+        expanded += 1
+        for neighbor in neighbors(state):
+            new_cost = cost + step_cost(state, neighbor)
+            if new_cost < best_g.get(neighbor, INF):
+                best_g[neighbor] = new_cost
+                parents[neighbor] = state
+                h = heuristic(neighbor)
+                counter += 1
+                heapq.heappush(frontier, (new_cost + h, h, counter, neighbor))
+
+    return finish(stats, SearchResult(False, [], None, expanded), counter, peak, best_g, parents)
+
+
+def depth_limited_search(problem, depth_limit, stats=None):
+    """DFS that stops expanding a branch once its cost reaches depth_limit.
+
+    A state is expanded again only if it is reached more cheaply than
+    before, so a cell first found deep in one branch is not lost to a
+    shallower branch explored later.  ``stats`` is an optional SearchStats
+    collector.
+    """
+    if stats is not None:
+        stats.start()
+    stack = [(problem.start, None, 0)]  # Pila: (estado, padre, costo)
+    best_cost = {}
+    parents = {}
+    expanded = 0
+    popped = peak = 0
+
+    while stack:
+        if stats is not None:
+            popped += 1
+            peak = max(peak, len(stack))
+        state, parent, cost = stack.pop()
+
+        if problem.is_goal(state):
+            parents[state] = parent
+            result = SearchResult(True, reconstruct_path(parents, state, problem), cost, expanded)
+            return finish(stats, result, popped + len(stack) - 1, peak, best_cost, parents)
+
+        if cost >= depth_limit or cost >= best_cost.get(state, INF):
+            continue
+        best_cost[state] = cost
+        parents[state] = parent
+
+        expanded += 1
+        for neighbor in problem.neighbors(state):
+            stack.append((neighbor, state, cost + problem.step_cost(state, neighbor)))
+
+    return finish(stats, SearchResult(False, [], None, expanded), popped - 1, peak, best_cost, parents)
+
+
+def iterative_deepening_search(problem, depth_limit, table=None, stats=None):
+    """IDA*: depth-first searches with a growing bound on f = g + h.
+
+    The bound starts at h(start) and grows to the smallest f that was cut
+    off, until the goal is reached or the bound passes depth_limit.  Within
+    one iteration best_g keeps the cheapest cost each state was reached at,
+    so it is never expanded twice at the same or a higher cost.
+
+    ``table`` is a transposition table of learned lower bounds on the cost
+    from a state to the goal.  It stays valid while the goal and the walls
+    do not change, so callers can keep it between turns.  ``stats`` is an
+    optional SearchStats collector; its frontier is the depth of the stack.
+    """
+    if stats is not None:
+        stats.start()
+    if table is None:
+        table = {}
+    neighbors, step_cost, is_goal = problem.neighbors, problem.step_cost, problem.is_goal
+    heuristic = problem.heuristic
+
+    def lower_bound(state):
+        return max(heuristic(state), table.get(state, 0))
+
+    start = problem.start
+    best_g = {start: 0}
+    if is_goal(start):
+        return finish(stats, SearchResult(True, [problem.decode(start)], 0, 0), 0, 1, best_g, table)
+
+    threshold = lower_bound(start)
+    expanded = 0
+    generated = peak = 0
+
+    while threshold <= depth_limit:
+        best_g = {start: 0}
+        next_threshold = INF
+        path = [start]
+        stack = [(start, 0, iter(neighbors(start)))]  # Pila: (estado, costo, hijos pendientes)
+        bounds = [INF]  # Menor f conocido por debajo de cada estado de la pila
+        expanded += 1
+
+        while stack:
+            state, cost, children = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                # Subárbol terminado: su cota se guarda para este y los próximos turnos
+                stack.pop()
+                path.pop()
+                bound = bounds.pop()
+                if bound - cost > table.get(state, 0):
+                    table[state] = bound - cost
+                if bounds:
+                    bounds[-1] = min(bounds[-1], bound)
+                continue
+
+            if stats is not None:
+                generated += 1
+                peak = max(peak, len(stack))
+            new_cost = cost + step_cost(state, child)
+            f = new_cost + lower_bound(child)
+            if f <= threshold and is_goal(child):
+                path.append(child)
+                result = SearchResult(True, [problem.decode(s) for s in path], new_cost, expanded)
+                return finish(stats, result, generated, peak, best_g, table)
+
+            if f > threshold:
+                next_threshold = min(next_threshold, f)
+                bounds[-1] = min(bounds[-1], f)
+            elif new_cost >= best_g.get(child, INF):
+                bounds[-1] = min(bounds[-1], f)  # Ya se exploró con más margen
+            else:
+                best_g[child] = new_cost
+                path.append(child)
+                stack.append((child, new_cost, iter(neighbors(child))))
+                bounds.append(INF)
+                expanded += 1
+
+        threshold = max(next_threshold, lower_bound(start))
+
+    return finish(stats, SearchResult(False, [], None, expanded), generated, peak, best_g, table)
+
+
+def _meeting_path(forward_parents, backward_parents, meet):
+    """States from the start to the goal through the meeting state of both trees."""
+    states = []
+    state = meet
+    while state is not None:
+        states.append(state)
+        state = forward_parents[state]
+    states.reverse()
+    state = backward_parents[meet]
+    while state is not None:
+        states.append(state)
+        state = backward_parents[state]
+    return states
+
+
+def bidirectional_breadth_first_search(problem, stats=None):
+    """BFS grown from both ends, one complete layer at a time.
+
+    The smaller frontier is expanded each round.  The first layer that
+    touches the other tree is finished before stopping, and the best meeting
+    point of that layer is kept, which gives a shortest path.  ``stats`` is
+    an optional SearchStats collector.
+    """
+    if stats is not None:
+        stats.start()
+    start, goal = problem.start, problem.goal
+    parents = ({start: None}, {goal: None})
+    if start == goal:
+        return finish(stats, SearchResult(True, [problem.decode(start)], 0, 0), 0, 1, *parents)
+
+    backward = problem.reversed()
+    depth = ({start: 0}, {goal: 0})
+    frontiers = ([start], [goal])
+    neighbors = (problem.neighbors, backward.neighbors)
+    expanded = 0
+    peak = 0
+
+    while frontiers[0] and frontiers[1]:
+        if stats is not None:
+            peak = max(peak, len(frontiers[0]) + len(frontiers[1]))
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own_parents, own_depth = parents[side], depth[side]
+        other_depth = depth[1 - side]
+        best, meet = INF, None
+        next_layer = []
+
+        for state in frontiers[side]:
+            expanded += 1
+            for neighbor in neighbors[side](state):
+                if neighbor in own_parents:
+                    continue
+                own_parents[neighbor] = state
+                own_depth[neighbor] = own_depth[state] + 1
+                next_layer.append(neighbor)
+                if neighbor in other_depth and own_depth[neighbor] + other_depth[neighbor] < best:
+                    best, meet = own_depth[neighbor] + other_depth[neighbor], neighbor
+
+        if meet is not None:
+            states = _meeting_path(parents[0], parents[1], meet)
+            cost = sum(problem.step_cost(a, b) for a, b in zip(states, states[1:]))
+            result = SearchResult(True, [problem.decode(state) for state in states], cost, expanded)
+            return finish(stats, result, len(parents[0]) + len(parents[1]) - 2, peak, *parents)
+
+        frontiers = (next_layer, frontiers[1]) if side == 0 else (frontiers[0], next_layer)
+
+    result = SearchResult(False, [], None, expanded)
+    return finish(stats, result, len(parents[0]) + len(parents[1]) - 2, peak, *parents)
+
+
+def bidirectional_astar_search(problem, stats=None):
+    """A* run from both ends at once, expanding the side with the smaller open list.
+
+    Each side uses its own heuristic (towards the goal, or back towards the
+    start).  Every time a generated state is already known to the other
+    side, the best meeting cost mu is updated.  The search stops as soon as
+    mu <= max(min f forward, min f backward), since with consistent
+    heuristics no undiscovered path can be cheaper than either bound.
+    ``stats`` is an optional SearchStats collector.
+    """
+    if stats is not None:
+        stats.start()
+    start, goal = problem.start, problem.goal
+    best_g = ({start: 0}, {goal: 0})
+    if start == goal:
+        return finish(stats, SearchResult(True, [problem.decode(start)], 0, 0), 0, 1, *best_g)
+
+    problems = (problem, problem.reversed())
+    parents = ({start: None}, {goal: None})
+    frontiers = ([], [])
+    for side in (0, 1):
+        h = problems[side].heuristic(problems[side].start)
+        frontiers[side].append((h, h, 0, problems[side].start))
+
+    def top_f(side):
+        frontier, costs = frontiers[side], best_g[side]
+        while frontier:
+            f, h, _, state = frontier[0]
+            if f <= costs[state] + h:
+                return f
+            heapq.heappop(frontier)  # Entrada obsoleta
+        return INF
+
+    mu, meet = INF, None
+    counter = 0
+    expanded = 0
+    peak = 0
+
+    while True:
+        forward_f, backward_f = top_f(0), top_f(1)
+        if forward_f == INF or backward_f == INF or mu <= max(forward_f, backward_f):
+            break
+        if stats is not None:
+            peak = max(peak, len(frontiers[0]) + len(frontiers[1]))
+
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        side_problem, own_g, other_g = problems[side], best_g[side], best_g[1 - side]
+        _, _, _, state = heapq.heappop(frontiers[side])
+        cost = own_g[state]
+
+        expanded += 1
+        for neighbor in side_problem.neighbors(state):
+            new_cost = cost + side_problem.step_cost(state, neighbor)
+            if new_cost < own_g.get(neighbor, INF):
+                own_g[neighbor] = new_cost
+                parents[side][neighbor] = state
+                h = side_problem.heuristic(neighbor)
+                counter += 1
+                heapq.heappush(frontiers[side], (new_cost + h, h, counter, neighbor))
+                if neighbor in other_g and new_cost + other_g[neighbor] < mu:
+                    mu, meet = new_cost + other_g[neighbor], neighbor
+
+    if meet is None:
+        return finish(stats, SearchResult(False, [], None, expanded), counter, peak, *best_g)
+    states = _meeting_path(parents[0], parents[1], meet)
+    result = SearchResult(True, [problem.decode(state) for state in states], mu, expanded)
+    return finish(stats, result, counter, peak, *best_g)
+
+
+def combined_search(problem, p_astar=0.4, rng=random, bidirectional=False, stats=None):
+    """
+    Combined search that alternates between BFS and A*.
+    It has a 40% chance (p_astar) to switch to A* on each call.
+    With bidirectional=True both algorithms grow from the start and the goal,
+    which a CookieProblem does not support.  ``stats`` is handed to the
+    search that runs.
+    """
+    if bidirectional and isinstance(problem, CookieProblem):
+        raise TypeError("combined_search: bidirectional=True necesita un problema con un único estado meta, no un CookieProblem")
+    if rng.random() <= p_astar:
+        search = bidirectional_astar_search if bidirectional else astar_search
+    else:
+        search = bidirectional_breadth_first_search if bidirectional else breadth_first_search
+    return search(problem, stats)
@@ -0,0 +1,56 @@
+"""Optional instrumentation of the searches: counts, peaks and timings."""
+
+import sys
+import time
+
+FIELDS = (
+    'searches', 'expanded', 'generated', 'peak_frontier',
+    'peak_visited', 'peak_visited_bytes', 'wall_time', 'cpu_time',
+)
+
+
+class SearchStats:
+    """Collector that a search fills in when it is passed as ``stats``.
+
+    One collector can be handed to several searches, e.g. every search of a
+    turn: counts and times add up and the peaks keep the maximum.  Searches
+    that get ``stats=None`` skip all of this bookkeeping.
+    """
+
+    __slots__ = FIELDS + ('_wall', '_cpu')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in FIELDS:
+            setattr(self, name, 0)
+        self.wall_time = self.cpu_time = 0.0
+        self._wall = self._cpu = None
+
+    def start(self):
+        """Called by a search on entry."""
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def record(self, expanded, generated, peak_frontier, *visited):
+        """Called by a search on exit; ``visited`` are its tables of seen states."""
+        self.wall_time += time.perf_counter() - self._wall
+        self.cpu_time += time.process_time() - self._cpu
+        self.searches += 1
+        self.expanded += expanded
+        self.generated += generated
+        self.peak_frontier = max(self.peak_frontier, peak_frontier)
+        if visited:
+            self.peak_visited = max(self.peak_visited, len(visited[0]))
+            self.peak_visited_bytes = max(self.peak_visited_bytes, sum(sys.getsizeof(v) for v in visited))
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+
+def finish(stats, result, generated, peak_frontier, *visited):
+    """Record a finished search in ``stats``, if there is one, and return its result."""
+    if stats is not None:
+        stats.record(result.expanded, generated, peak_frontier, *visited)
+    return result